@@ -14,13 +14,242 @@ Usage:
     memory.log_decision(agent="frontend-specialist", decision="...", context="...")
 """
 
+import atexit
+import heapq
 import json
+from collections import Counter
+from dataclasses import dataclass
+import mmap
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any
+from typing import Iterator, Optional, Any
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Buffer size for the persistent decisions writer
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Appends arriving within this window share one background fsync
+_FSYNC_WINDOW = 0.01
+
+# agent-performance.json is rewritten after this many pending task results,
+# or once this many seconds have passed since the last write
+_PERF_FLUSH_BATCH = 32
+_PERF_FLUSH_INTERVAL = 1.0
+
+# Rosters at least this large are scored with NumPy (when installed)
+_VECTORIZE_MIN_AGENTS = 64
+
+# Top-level "timestamp" value of a raw decisions.jsonl line. Quotes inside
+# JSON strings are always escaped, so this cannot match inside a value.
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]*)"')
+
+# Leading indentation of each line: a tab, 4+ spaces, or 2-3 spaces
+_INDENT_RE = re.compile(r"^(\t| {4}| {2})", re.MULTILINE)
+
+# Default file structures, shared across instances. Copy them with
+# _copy_template() before mutating.
+_DEFAULT_PATTERNS = {
+    "schema_version": "1.0",
+    "last_updated": None,
+    "code_style": {
+        "naming": None,
+        "imports": None,
+        "prefer_immutability": None,
+        "string_quotes": None,
+        "indentation": None,
+        "max_line_length": None
+    },
+    "architecture": {
+        "state_management": None,
+        "api_pattern": None,
+        "testing_framework": None,
+        "styling": None,
+        "bundler": None,
+        "package_manager": None
+    },
+    "preferences": {
+        "communication_style": "concise",
+        "risk_tolerance": "balanced",
+        "documentation_level": "minimal"
+    },
+    "detected_stack": [],
+    "custom_patterns": {}
+}
+
+_DEFAULT_PERFORMANCE = {
+    "schema_version": "1.0",
+    "last_updated": None,
+    "agents": {},
+    "routing_preferences": {},
+    "skill_gaps": []
+}
+
+_DEFAULT_AGENT_STATS = {
+    "total_tasks": 0,
+    "successful": 0,
+    "failed": 0,
+    "accuracy": 0.0,
+    "avg_response_quality": 0.0,
+    "specializations": [],
+    "last_used": None
+}
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _copy_template(template: dict) -> dict:
+    """
+    Copy a default template for mutation.
+
+    Templates nest at most one container deep with scalar leaves, so copying
+    each top-level container is enough (and cheaper than copy.deepcopy).
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in template.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _iso_second_prefix(epoch_seconds: int) -> str:
+    """ISO 8601 'YYYY-MM-DDTHH:MM:SS' for a UTC epoch second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_seconds))
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a 'Z' suffix."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second_prefix(seconds)}.{nanos // 1000:06d}Z"
+
+
+def _iter_mapped_lines(path: Path, start: int = 0) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield (offset, line) pairs from a memory-mapped file.
+
+    Lines keep their trailing newline; a final unterminated line is
+    yielded without one, like iterating over a binary file object.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= start:
+            return  # Nothing to read (and mmap rejects empty files)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                end = size if end == -1 else end + 1
+                yield pos, mm[pos:end]
+                pos = end
+
+
+def _line_timestamp(line: bytes) -> Optional[str]:
+    """Top-level timestamp of a raw log line; None for blank or corrupt lines."""
+    if not line.strip():
+        return None
+    match = _TIMESTAMP_RE.search(line)
+    if match:
+        return match.group(1).decode("utf-8", "replace")
+    try:
+        record = _loads(line)
+    except json.JSONDecodeError:
+        return None
+    return record.get("timestamp", "") if isinstance(record, dict) else None
+
+
+def _copy_range(src, dst, offset: int, count: int) -> None:
+    """
+    Copy count bytes of src, starting at offset, to dst's current position.
+
+    Uses os.sendfile() (kernel-to-kernel, no userspace copy) where the
+    platform supports it for regular files, and a buffered loop otherwise.
+    """
+    if hasattr(os, "sendfile"):
+        try:
+            while count > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+        except OSError:
+            pass  # e.g. macOS only sends to sockets; finish below
+
+    src.seek(offset)
+    while count > 0:
+        chunk = src.read(min(count, _WRITE_BUFFER_SIZE))
+        if not chunk:
+            break
+        dst.write(chunk)
+        count -= len(chunk)
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write payload to a sibling temp file and rename it over path."""
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_file, path)
+
+
+@dataclass(slots=True, frozen=True)
+class Decision:
+    """A logged decision with its resolved outcome (compact, read-only)."""
+    id: str
+    timestamp: str
+    agent: str
+    decision: str
+    context: str
+    outcome: Optional[str] = None
+    tags: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict, outcome: Optional[str] = None) -> "Decision":
+        """Build from a decisions.jsonl record, optionally overriding the outcome."""
+        return cls(
+            id=data["id"],
+            timestamp=data.get("timestamp", ""),
+            agent=data.get("agent", ""),
+            decision=data.get("decision", ""),
+            context=data.get("context", ""),
+            outcome=outcome if outcome is not None else data.get("outcome"),
+            tags=tuple(data.get("tags") or ())
+        )
+
+    def to_dict(self) -> dict:
+        """Return the record in its decisions.jsonl dict form."""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "agent": self.agent,
+            "decision": self.decision,
+            "context": self.context,
+            "outcome": self.outcome,
+            "tags": list(self.tags)
+        }
+
 
 class MemoryManager:
     """Manages persistent memory across Claude Code sessions."""
@@ -37,12 +266,44 @@ class MemoryManager:
 
         # Ensure directories exist
         self.memory_path.mkdir(parents=True, exist_ok=True)
-        (self.memory_path / "session-summaries").mkdir(exist_ok=True)
+        self.summaries_path = self.memory_path / "session-summaries"
+        self.summaries_path.mkdir(exist_ok=True)
 
         # File paths
         self.decisions_file = self.memory_path / "decisions.jsonl"
         self.patterns_file = self.memory_path / "project-patterns.json"
         self.performance_file = self.memory_path / "agent-performance.json"
+        self.decisions_index_file = self.memory_path / "decisions.idx.json"
+        # Copy of the most recent session summary, so reads skip the dir scan
+        self.latest_session_file = self.summaries_path / "latest.json"
+
+        # Persistent append handle for decisions.jsonl (opened lazily)
+        self._decisions_fp = None
+
+        # Background fsync of the decisions writer (started with the writer)
+        self._flush_q: Optional[queue.SimpleQueue] = None
+        self._flusher: Optional[threading.Thread] = None
+        self._fsync_pending = False
+
+        # decision_id -> {"offset", "agent", "outcome"}, loaded lazily
+        self._decision_index: Optional[dict[str, dict]] = None
+        # tag -> byte offsets of the decision records carrying it
+        self._tag_index: dict[str, list[int]] = {}
+        self._indexed_size = 0
+        self._index_dirty = False
+
+        # Parsed decisions, valid while the log's (mtime_ns, size) is unchanged
+        self._decisions_cache: Optional[list[dict]] = None
+        self._decisions_cache_stat: Optional[tuple[int, int]] = None
+        self._decisions_cache_pending = False
+
+        # Parsed patterns/performance files: path -> ((mtime_ns, size), data)
+        self._json_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+        # Task results recorded in memory but not yet written to disk
+        self._perf_data: Optional[dict] = None
+        self._perf_pending = 0
+        self._perf_last_flush = time.monotonic()
 
     # =========================================================================
     # DECISION LOGGING
@@ -69,12 +330,49 @@ class MemoryManager:
         Returns:
             The decision ID
         """
+        entry = self._new_decision_entry(agent, decision, context, tags, decision_id)
+        self._append_entries([entry])
+        return entry["id"]
+
+    def log_decisions_batch(self, decisions: list[dict]) -> list[str]:
+        """
+        Log several decisions with a single write.
+
+        Args:
+            decisions: List of dicts with the same keys as log_decision()
+                arguments (agent, decision, context, tags, decision_id)
+
+        Returns:
+            The decision IDs, in input order
+        """
+        entries = [
+            self._new_decision_entry(
+                d["agent"],
+                d["decision"],
+                d["context"],
+                d.get("tags"),
+                d.get("decision_id")
+            )
+            for d in decisions
+        ]
+        self._append_entries(entries)
+        return [entry["id"] for entry in entries]
+
+    def _new_decision_entry(
+        self,
+        agent: str,
+        decision: str,
+        context: str,
+        tags: Optional[list[str]],
+        decision_id: Optional[str]
+    ) -> dict:
+        """Build a decision record ready to be appended."""
         if decision_id is None:
             decision_id = f"d{uuid.uuid4().hex[:8]}"
 
-        entry = {
+        return {
             "id": decision_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _now_iso(),
             "agent": agent,
             "decision": decision,
             "context": context,
@@ -82,10 +380,205 @@ class MemoryManager:
             "tags": tags or []
         }
 
-        with open(self.decisions_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    def _append_entries(self, entries: list[dict]) -> None:
+        """Serialize entries into one buffer and append it to decisions.jsonl."""
+        if not entries:
+            return
+        lines = [
+            _dumps(entry) + b"\n"
+            for entry in entries
+        ]
+        payload = b"".join(lines)
+        fp = self._get_decisions_writer()
+        fp.write(payload)
+        self._schedule_fsync()
+
+        if self._decisions_cache is not None:
+            # Our own appends keep the cache valid; only the mtime changes
+            mtime_ns, size = self._decisions_cache_stat
+            self._decisions_cache.extend(entries)
+            self._decisions_cache_stat = (mtime_ns, size + len(payload))
+            self._decisions_cache_pending = True
+
+        if self._decision_index is not None:
+            # Offsets come from the real end of file: other instances or
+            # processes may have appended since our last indexed record
+            fp.flush()
+            offset = fp.tell() - len(payload)
+            if offset != self._indexed_size:
+                self._catch_up_index()  # Indexes their records and ours
+            else:
+                for entry, line in zip(entries, lines, strict=True):
+                    self._index_record(entry, offset)
+                    offset += len(line)
+                self._indexed_size = offset
+            self._mark_index_dirty()
+
+    def _get_decisions_writer(self):
+        """Return the buffered append handle, opening it on first use."""
+        if self._decisions_fp is None:
+            self._decisions_fp = open(
+                self.decisions_file, "ab", buffering=_WRITE_BUFFER_SIZE
+            )
+            atexit.register(self.close)
+        return self._decisions_fp
+
+    def _schedule_fsync(self) -> None:
+        """Ask the flusher thread to fsync, unless a request is already queued."""
+        if self._flusher is None:
+            self._flush_q = queue.SimpleQueue()
+            self._flusher = threading.Thread(
+                target=self._flusher_loop, name="memory-fsync", daemon=True
+            )
+            self._flusher.start()
+
+        if not self._fsync_pending:
+            self._fsync_pending = True
+            self._flush_q.put(True)
+
+    def _flusher_loop(self) -> None:
+        """Flush and fsync the decisions writer until told to stop."""
+        while self._flush_q.get():
+            time.sleep(_FSYNC_WINDOW)  # Let concurrent appends join this fsync
+            self._fsync_pending = False
+            fp = self._decisions_fp
+            if fp is not None:
+                try:
+                    fp.flush()
+                    os.fsync(fp.fileno())
+                except (OSError, ValueError):
+                    pass  # Best effort; close() flushes again
+
+    def _stop_flusher(self) -> None:
+        """Drain pending fsync requests and stop the flusher thread."""
+        if self._flusher is not None:
+            self._flush_q.put(False)
+            self._flusher.join()
+            self._flusher = None
+            self._flush_q = None
+            self._fsync_pending = False
+
+    def flush(self) -> None:
+        """Flush buffered decision writes to disk."""
+        if self._decisions_fp is not None:
+            self._decisions_fp.flush()
+
+    def close(self) -> None:
+        """Flush and close the decisions writer and persist pending state."""
+        self.flush_performance()
+        # Stop the flusher before closing the file it fsyncs
+        self._stop_flusher()
+        if self._decisions_fp is not None:
+            self._decisions_fp.close()
+            self._decisions_fp = None
+            atexit.unregister(self.close)
+        if self._index_dirty:
+            self._save_decision_index()
+
+    # -------------------------------------------------------------------------
+    # Decision index (decision_id -> byte offset + outcome state)
+    # -------------------------------------------------------------------------
+
+    def _get_decision_index(self) -> dict[str, dict]:
+        """Return the decision index, loading it from disk on first use."""
+        if self._decision_index is not None:
+            return self._decision_index
+
+        self.flush()
+        size = self.decisions_file.stat().st_size if self.decisions_file.exists() else 0
+
+        self._decision_index = {}
+        self._tag_index = {}
+        self._indexed_size = 0
+        try:
+            with open(self.decisions_index_file, "rb") as f:
+                data = _loads(f.read())
+            entries, tags, indexed_size = data["entries"], data["tags"], data["size"]
+            # A persisted index covering more bytes than the log is stale
+            if indexed_size <= size:
+                self._decision_index = entries
+                self._tag_index = tags
+                self._indexed_size = indexed_size
+        except (json.JSONDecodeError, KeyError, TypeError, IOError):
+            pass
+
+        self._catch_up_index()
+        return self._decision_index
+
+    def _catch_up_index(self) -> None:
+        """Index log lines appended since the last indexed offset."""
+        self.flush()
+        if not self.decisions_file.exists():
+            return
+
+        offset = self._indexed_size
+        for line_offset, line in _iter_mapped_lines(self.decisions_file, offset):
+            if not line.endswith(b"\n"):
+                break  # Partial trailing write
+            try:
+                self._index_record(_loads(line), line_offset)
+            except json.JSONDecodeError:
+                pass
+            offset = line_offset + len(line)
+
+        if offset != self._indexed_size:
+            self._indexed_size = offset
+            self._mark_index_dirty()
+
+    def _index_record(self, record: dict, offset: int) -> None:
+        """Add a decision or outcome update record to the index."""
+        decision_id = record.get("id")
+        if decision_id is None:
+            return
+
+        if record.get("_type") == "outcome_update":
+            indexed = self._decision_index.get(decision_id)
+            if indexed is not None:
+                indexed["outcome"] = record.get("outcome")
+        else:
+            self._decision_index[decision_id] = {
+                "offset": offset,
+                "agent": record.get("agent"),
+                "outcome": record.get("outcome")
+            }
+            for tag in record.get("tags") or ():
+                if isinstance(tag, str):
+                    self._tag_index.setdefault(tag, []).append(offset)
+
+    def _mark_index_dirty(self) -> None:
+        """Flag the index as unsaved and make sure it is persisted at exit."""
+        if not self._index_dirty:
+            self._index_dirty = True
+            atexit.register(self._save_decision_index)
+
+    def _save_decision_index(self) -> None:
+        """Persist the decision index next to the log, if it covers the whole file."""
+        # Flushes buffered appends first (atexit may run this before close())
+        self._catch_up_index()
+        self._index_dirty = False
+        atexit.unregister(self._save_decision_index)
 
-        return decision_id
+        try:
+            size = self.decisions_file.stat().st_size
+        except FileNotFoundError:
+            return
+        if size != self._indexed_size:
+            return  # Partial trailing write or rewritten log; rebuild next time
+
+        _atomic_write(self.decisions_index_file, _dumps({
+            "size": self._indexed_size,
+            "entries": self._decision_index,
+            "tags": self._tag_index
+        }))
+
+    def _reset_decision_index(self) -> None:
+        """Drop the index after the log has been rewritten."""
+        self._decision_index = None
+        self._tag_index = {}
+        self._indexed_size = 0
+        self._index_dirty = False
+        atexit.unregister(self._save_decision_index)
+        self.decisions_index_file.unlink(missing_ok=True)
 
     def update_outcome(
         self,
@@ -104,50 +597,157 @@ class MemoryManager:
         Returns:
             True if decision was found and updated
         """
-        # Find the original decision
-        original = None
-        for decision in self.get_all_decisions():
-            if decision["id"] == decision_id and decision["outcome"] is None:
-                original = decision
-                break
-
+        index = self._get_decision_index()
+        original = index.get(decision_id)
         if original is None:
+            # May have been appended by another writer since we indexed
+            self._catch_up_index()
+            original = index.get(decision_id)
+
+        if original is None or original["outcome"] is not None:
             return False
 
         # Append outcome update
         update_entry = {
             "id": decision_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _now_iso(),
             "outcome": outcome,
             "outcome_notes": notes,
             "_type": "outcome_update"
         }
 
-        with open(self.decisions_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(update_entry, ensure_ascii=False) + "\n")
+        self._append_entries([update_entry])
 
         # Update agent performance
-        if original:
+        if original["agent"]:
             self._update_agent_stats(original["agent"], outcome == "success")
 
         return True
 
+    def get_decision(self, decision_id: str) -> Optional[dict]:
+        """
+        Get a single decision by ID, with its latest outcome applied.
+
+        Seeks straight to the record via the offset index instead of
+        scanning the log.
+
+        Returns:
+            The decision, or None if it is not in the log
+        """
+        index = self._get_decision_index()
+        indexed = index.get(decision_id)
+        if indexed is None:
+            self._catch_up_index()
+            indexed = index.get(decision_id)
+            if indexed is None:
+                return None
+
+        self.flush()
+        with open(self.decisions_file, "rb") as f:
+            f.seek(indexed["offset"])
+            line = f.readline()
+
+        try:
+            decision = _loads(line)
+        except json.JSONDecodeError:
+            return None
+        if decision.get("id") != decision_id:
+            return None  # Index is stale (log rewritten by another process)
+
+        decision["outcome"] = indexed["outcome"]
+        return decision
+
+    def iter_decisions(self, tags: Optional[list[str]] = None) -> Iterator[Decision]:
+        """
+        Iterate decisions in log order as Decision objects, outcomes applied.
+
+        Outcome update records are folded in rather than yielded. Unlike
+        get_all_decisions(), nothing is materialized when the parse cache is
+        cold, and each item is a slotted object instead of a dict.
+
+        Args:
+            tags: Optional tags; only decisions carrying one of them are yielded
+        """
+        index = self._get_decision_index()
+        self._catch_up_index()
+        tag_set = frozenset(tags) if tags else None
+
+        for record in self._iter_decisions():
+            if record.get("_type") == "outcome_update" or "id" not in record:
+                continue
+            if tag_set is not None and tag_set.isdisjoint(record.get("tags") or ()):
+                continue
+            indexed = index.get(record["id"])
+            yield Decision.from_dict(record, indexed["outcome"] if indexed else None)
+
     def get_all_decisions(self) -> list[dict]:
-        """Get all decisions from the log."""
-        if not self.decisions_file.exists():
+        """
+        Get all decisions from the log.
+
+        The parsed log is cached and reused while the file's mtime and size
+        are unchanged. Returned dicts are shared with the cache and must not
+        be mutated.
+        """
+        cached = self._get_cached_decisions()
+        if cached is not None:
+            return list(cached)
+
+        try:
+            st = os.stat(self.decisions_file)
+        except FileNotFoundError:
             return []
 
-        decisions = []
-        with open(self.decisions_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        decisions.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        decisions = list(self._read_decisions())
+
+        self._decisions_cache = decisions
+        self._decisions_cache_stat = (st.st_mtime_ns, st.st_size)
+        self._decisions_cache_pending = False
+        return list(decisions)
+
+    def _iter_decisions(self) -> Iterator[dict]:
+        """Yield decisions one at a time, from the cache when it is valid."""
+        cached = self._get_cached_decisions()
+        if cached is not None:
+            yield from cached
+        elif self.decisions_file.exists():
+            yield from self._read_decisions()
+
+    def _read_decisions(self) -> Iterator[dict]:
+        """Stream-parse decisions.jsonl, skipping blank or corrupt lines."""
+        for _, line in _iter_mapped_lines(self.decisions_file):
+            line = line.strip()
+            if line:
+                try:
+                    yield _loads(line)
+                except json.JSONDecodeError:
+                    continue
 
-        return decisions
+    def _get_cached_decisions(self) -> Optional[list[dict]]:
+        """Return the cached decisions if the log is unchanged, else None."""
+        self.flush()
+        try:
+            st = os.stat(self.decisions_file)
+        except FileNotFoundError:
+            self._invalidate_decisions_cache()
+            return None
+
+        if self._decisions_cache is None:
+            return None
+
+        mtime_ns, size = self._decisions_cache_stat
+        if st.st_size == size and (
+            st.st_mtime_ns == mtime_ns or self._decisions_cache_pending
+        ):
+            self._decisions_cache_stat = (st.st_mtime_ns, size)
+            self._decisions_cache_pending = False
+            return self._decisions_cache
+        return None
+
+    def _invalidate_decisions_cache(self) -> None:
+        """Forget the parsed decisions so the next read re-parses the log."""
+        self._decisions_cache = None
+        self._decisions_cache_stat = None
+        self._decisions_cache_pending = False
 
     def get_relevant_context(
         self,
@@ -166,43 +766,78 @@ class MemoryManager:
         Returns:
             List of relevant decisions, most recent first
         """
-        all_decisions = self.get_all_decisions()
-
-        # Filter out outcome updates
-        decisions = [d for d in all_decisions if d.get("_type") != "outcome_update"]
-
-        # Apply outcome updates
-        outcomes = {d["id"]: d for d in all_decisions if d.get("_type") == "outcome_update"}
-        for decision in decisions:
-            if decision["id"] in outcomes:
-                decision["outcome"] = outcomes[decision["id"]]["outcome"]
+        tag_set = set(tags) if tags else None
+        tagged = None
+        if tag_set is not None and self._get_cached_decisions() is None:
+            # Cold cache: parse only the records the tag index points at
+            self._get_decision_index()
+            self._catch_up_index()
+            tagged = self._read_tagged_decisions(tag_set)
+
+        # Top-k by timestamp (newest first); same order as a stable sort
+        if tagged is not None:
+            newest = heapq.nlargest(limit, tagged, key=lambda d: d.get("timestamp", ""))
+            index = self._decision_index
+            outcomes = {
+                d["id"]: index[d["id"]]["outcome"] for d in newest if d["id"] in index
+            }
+        else:
+            # Full scan: outcome updates come from the same pass, no index needed
+            outcomes = {}
+            candidates = []
+            for d in self.get_all_decisions():
+                if d.get("_type") == "outcome_update":
+                    outcomes[d["id"]] = d.get("outcome")
+                elif tag_set is None or not tag_set.isdisjoint(d.get("tags", ())):
+                    candidates.append(d)
+            newest = heapq.nlargest(limit, candidates, key=lambda d: d.get("timestamp", ""))
+
+        # Apply outcome updates (on copies; the log is cached)
+        result = []
+        for decision in newest:
+            outcome = outcomes.get(decision["id"], decision.get("outcome"))
+            if outcome != decision.get("outcome"):
+                decision = {**decision, "outcome": outcome}
+            result.append(decision)
+        return result
+
+    def _read_tagged_decisions(self, tag_set: set[str]) -> Optional[list[dict]]:
+        """
+        Read the decisions carrying any of the tags via the tag index.
 
-        # Filter by tags if provided
-        if tags:
-            tag_set = set(tags)
-            decisions = [
-                d for d in decisions
-                if tag_set.intersection(set(d.get("tags", [])))
-            ]
+        Returns the records in log order, or None if the index turns out to
+        be stale (the caller then falls back to a full scan).
+        """
+        offsets = sorted(set().union(*(self._tag_index.get(tag, ()) for tag in tag_set)))
+        if not offsets:
+            return []
 
-        # Sort by timestamp (newest first) and limit
-        decisions.sort(key=lambda d: d.get("timestamp", ""), reverse=True)
-        return decisions[:limit]
+        decisions = []
+        with open(self.decisions_file, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    decision = _loads(f.readline())
+                except json.JSONDecodeError:
+                    decision = None
+                if not isinstance(decision, dict) or tag_set.isdisjoint(decision.get("tags") or ()):
+                    self._reset_decision_index()
+                    return None
+                decisions.append(decision)
+        return decisions
 
     # =========================================================================
     # PROJECT PATTERNS
     # =========================================================================
 
     def get_patterns(self) -> dict:
-        """Get current project patterns."""
-        if not self.patterns_file.exists():
-            return self._default_patterns()
+        """
+        Get current project patterns.
 
-        try:
-            with open(self.patterns_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return self._default_patterns()
+        The returned dict is cached between calls; use update_patterns()
+        rather than mutating it.
+        """
+        return self._load_json_cached(self.patterns_file, self._default_patterns)
 
     def update_patterns(self, updates: dict) -> None:
         """
@@ -211,14 +846,11 @@ class MemoryManager:
         Args:
             updates: Dictionary of pattern updates (will be merged)
         """
-        patterns = self.get_patterns()
+        # Merge into a copy: the cached patterns only change once the write succeeds
+        patterns = self._deep_merge(self.get_patterns(), updates)
+        patterns["last_updated"] = _now_iso()
 
-        # Deep merge
-        self._deep_merge(patterns, updates)
-        patterns["last_updated"] = datetime.utcnow().isoformat() + "Z"
-
-        with open(self.patterns_file, "w", encoding="utf-8") as f:
-            json.dump(patterns, f, indent=2, ensure_ascii=False)
+        self._save_json_cached(self.patterns_file, patterns)
 
     def learn_patterns_from_code(self, file_path: str, content: str) -> dict:
         """
@@ -241,11 +873,11 @@ class MemoryManager:
         elif double_quotes > single_quotes * 1.5:
             detected["string_quotes"] = "double"
 
-        # Detect indentation
-        lines = content.split("\n")
-        two_space = sum(1 for line in lines if line.startswith("  ") and not line.startswith("    "))
-        four_space = sum(1 for line in lines if line.startswith("    "))
-        tab_indent = sum(1 for line in lines if line.startswith("\t"))
+        # Detect indentation (one regex scan instead of splitting into lines)
+        indents = Counter(_INDENT_RE.findall(content))
+        two_space = indents["  "]
+        four_space = indents["    "]
+        tab_indent = indents["\t"]
 
         if tab_indent > two_space and tab_indent > four_space:
             detected["indentation"] = "tabs"
@@ -267,41 +899,55 @@ class MemoryManager:
 
     def _default_patterns(self) -> dict:
         """Return default patterns structure."""
-        return {
-            "schema_version": "1.0",
-            "last_updated": None,
-            "code_style": {
-                "naming": None,
-                "imports": None,
-                "prefer_immutability": None,
-                "string_quotes": None,
-                "indentation": None,
-                "max_line_length": None
-            },
-            "architecture": {
-                "state_management": None,
-                "api_pattern": None,
-                "testing_framework": None,
-                "styling": None,
-                "bundler": None,
-                "package_manager": None
-            },
-            "preferences": {
-                "communication_style": "concise",
-                "risk_tolerance": "balanced",
-                "documentation_level": "minimal"
-            },
-            "detected_stack": [],
-            "custom_patterns": {}
-        }
+        return _copy_template(_DEFAULT_PATTERNS)
+
+    def _deep_merge(self, base: dict, updates: dict) -> dict:
+        """Return base deep-merged with updates; base itself is left untouched."""
+        merged = dict(base)
+        stack = [(merged, updates)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    # Copy only the dicts on the merge path
+                    target[key] = current = dict(current)
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+        return merged
+
+    def _load_json_cached(self, path: Path, default_factory) -> dict:
+        """
+        Load a JSON file, reusing the parsed data while mtime/size match.
 
-    def _deep_merge(self, base: dict, updates: dict) -> None:
-        """Deep merge updates into base dict."""
-        for key, value in updates.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        Falls back to default_factory() if the file is missing or corrupt.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._json_cache.pop(path, None)
+            return default_factory()
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, "rb") as f:
+                data = _loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            return default_factory()
+
+        self._json_cache[path] = (key, data)
+        return data
+
+    def _save_json_cached(self, path: Path, data: dict) -> None:
+        """Atomically rewrite a JSON file and keep data as its cached copy."""
+        _atomic_write(path, _dumps(data, indent=True))
+        st = os.stat(path)
+        self._json_cache[path] = ((st.st_mtime_ns, st.st_size), data)
 
     # =========================================================================
     # AGENT PERFORMANCE
@@ -315,19 +961,16 @@ class MemoryManager:
             agent: Specific agent name, or None for all agents
 
         Returns:
-            Performance data
+            Performance data (cached between calls; do not mutate)
         """
-        if not self.performance_file.exists():
-            return self._default_performance()
-
-        try:
-            with open(self.performance_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            data = self._default_performance()
+        if self._perf_pending:
+            data = self._perf_data
+        else:
+            data = self._load_json_cached(self.performance_file, self._default_performance)
 
         if agent:
-            return data.get("agents", {}).get(agent, self._default_agent_stats())
+            stats = data.get("agents", {}).get(agent)
+            return stats if stats is not None else _copy_template(_DEFAULT_AGENT_STATS)
         return data
 
     def record_task_result(
@@ -372,11 +1015,30 @@ class MemoryManager:
                 (current_quality * (total - 1) + quality_score) / total, 3
             )
 
-        stats["last_used"] = datetime.utcnow().isoformat() + "Z"
-        data["last_updated"] = datetime.utcnow().isoformat() + "Z"
-
-        with open(self.performance_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        now = _now_iso()
+        stats["last_used"] = now
+        data["last_updated"] = now
+
+        self._perf_data = data
+        if not self._perf_pending:
+            atexit.register(self.flush_performance)
+        self._perf_pending += 1
+
+        if (
+            self._perf_pending >= _PERF_FLUSH_BATCH
+            or time.monotonic() - self._perf_last_flush >= _PERF_FLUSH_INTERVAL
+        ):
+            self.flush_performance()
+
+    def flush_performance(self) -> None:
+        """Write pending task results to agent-performance.json."""
+        if not self._perf_pending:
+            return
+        self._save_json_cached(self.performance_file, self._perf_data)
+        self._perf_data = None
+        self._perf_pending = 0
+        self._perf_last_flush = time.monotonic()
+        atexit.unregister(self.flush_performance)
 
     def get_best_agent_for(
         self,
@@ -399,6 +1061,12 @@ class MemoryManager:
         if not agents:
             return None
 
+        if len(agents) >= _VECTORIZE_MIN_AGENTS:
+            try:
+                return self._best_agent_vectorized(agents, required_skills)
+            except ImportError:
+                pass  # NumPy not installed; score in pure Python
+
         # Score agents
         scored = []
         for name, stats in agents.items():
@@ -417,8 +1085,48 @@ class MemoryManager:
         if not scored:
             return None
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[0][0]
+        # max() keeps the first of equal scores, like a stable descending sort
+        return max(scored, key=lambda x: x[1])[0]
+
+    def _best_agent_vectorized(
+        self,
+        agents: dict,
+        required_skills: Optional[list[str]]
+    ) -> Optional[str]:
+        """NumPy variant of get_best_agent_for() scoring for large rosters."""
+        # Imported here so the common small-roster path never pays for NumPy
+        import numpy as np
+
+        names = list(agents)
+        stats_list = list(agents.values())
+        n = len(names)
+
+        accuracy = np.fromiter(
+            (s["accuracy"] for s in stats_list), dtype=np.float64, count=n
+        )
+        quality = np.fromiter(
+            (s.get("avg_response_quality", 0.5) for s in stats_list),
+            dtype=np.float64,
+            count=n
+        )
+        eligible = np.fromiter(
+            (s["total_tasks"] >= 1 for s in stats_list), dtype=bool, count=n
+        )
+
+        if required_skills:
+            skills = set(required_skills)
+            eligible &= np.fromiter(
+                (not skills.isdisjoint(s.get("specializations", [])) for s in stats_list),
+                dtype=bool,
+                count=n
+            )
+
+        if not eligible.any():
+            return None
+
+        scores = np.where(eligible, accuracy * 0.6 + quality * 0.4, -np.inf)
+        # argmax returns the first maximum, matching the pure-Python path
+        return names[int(np.argmax(scores))]
 
     def _update_agent_stats(self, agent: str, success: bool) -> None:
         """Update agent stats from decision outcome."""
@@ -426,25 +1134,11 @@ class MemoryManager:
 
     def _default_performance(self) -> dict:
         """Return default performance structure."""
-        return {
-            "schema_version": "1.0",
-            "last_updated": None,
-            "agents": {},
-            "routing_preferences": {},
-            "skill_gaps": []
-        }
+        return _copy_template(_DEFAULT_PERFORMANCE)
 
     def _default_agent_stats(self) -> dict:
         """Return default agent stats structure."""
-        return {
-            "total_tasks": 0,
-            "successful": 0,
-            "failed": 0,
-            "accuracy": 0.0,
-            "avg_response_quality": 0.0,
-            "specializations": [],
-            "last_used": None
-        }
+        return _copy_template(_DEFAULT_AGENT_STATS)
 
     # =========================================================================
     # SESSION SUMMARIES
@@ -475,7 +1169,7 @@ class MemoryManager:
         summary_data = {
             "session_id": session_id,
             "started_at": None,  # Could be tracked separately
-            "ended_at": datetime.utcnow().isoformat() + "Z",
+            "ended_at": _now_iso(),
             "summary": summary,
             "decisions_made": decisions_made,
             "files_modified": files_modified,
@@ -484,17 +1178,27 @@ class MemoryManager:
             "next_session_context": next_session_context
         }
 
-        summary_file = self.memory_path / "session-summaries" / f"{session_id}.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        payload = _dumps(summary_data, indent=True)
+        summary_file = self.summaries_path / f"{session_id}.json"
+        with open(summary_file, "wb") as f:
+            f.write(payload)
+
+        # Atomically repoint latest.json at this summary
+        _atomic_write(self.latest_session_file, payload)
 
     def get_latest_session(self) -> Optional[dict]:
         """Get the most recent session summary."""
-        summaries_dir = self.memory_path / "session-summaries"
+        try:
+            with open(self.latest_session_file, "rb") as f:
+                return _loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            pass  # No pointer yet (older memory dir) - scan summaries
+
+        summaries_dir = self.summaries_path
         if not summaries_dir.exists():
             return None
 
-        files = list(summaries_dir.glob("*.json"))
+        files = self._session_summary_files()
         if not files:
             return None
 
@@ -502,11 +1206,18 @@ class MemoryManager:
         files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
 
         try:
-            with open(files[0], "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(files[0], "rb") as f:
+                return _loads(f.read())
         except (json.JSONDecodeError, IOError):
             return None
 
+    def _session_summary_files(self) -> list[Path]:
+        """List per-session summary files, excluding the latest.json pointer."""
+        return [
+            f for f in self.summaries_path.glob("*.json")
+            if f.name != self.latest_session_file.name
+        ]
+
     def get_next_session_context(self) -> Optional[str]:
         """Get the context hint from the previous session."""
         latest = self.get_latest_session()
@@ -531,49 +1242,108 @@ class MemoryManager:
         from datetime import timedelta
 
         cutoff = datetime.utcnow() - timedelta(days=keep_days)
-        cutoff_str = cutoff.isoformat() + "Z"
+        cutoff_str = cutoff.isoformat(timespec="microseconds") + "Z"
 
-        decisions = self.get_all_decisions()
-        kept = []
-        archived = []
+        if not self.decisions_file.exists():
+            return {"kept": 0, "archived": 0, "archive_file": None}
+        self.close()
+
+        # Classify lines first. The log is appended in time order, so the
+        # archived entries normally form a prefix that can be moved as-is.
+        kept = 0
+        archived = 0
+        split = None  # Offset of the first kept line
+        is_prefix = True
+        for offset, line in _iter_mapped_lines(self.decisions_file):
+            timestamp = _line_timestamp(line)
+            if timestamp is None or not line.endswith(b"\n"):
+                is_prefix = False  # Blank, corrupt or unterminated line to clean up
+                if timestamp is None:
+                    continue
 
-        for decision in decisions:
-            if decision.get("timestamp", "") >= cutoff_str:
-                kept.append(decision)
+            if timestamp >= cutoff_str:
+                kept += 1
+                if split is None:
+                    split = offset
             else:
-                archived.append(decision)
-
-        # Rewrite decisions file with only kept entries
-        if archived:
-            with open(self.decisions_file, "w", encoding="utf-8") as f:
-                for decision in kept:
-                    f.write(json.dumps(decision, ensure_ascii=False) + "\n")
+                archived += 1
+                if split is not None:
+                    is_prefix = False
+
+        if not archived:
+            return {"kept": kept, "archived": 0, "archive_file": None}
+
+        # Save archived to separate file, rewrite decisions with kept entries
+        archive_file = self.memory_path / f"decisions-archive-{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
+        tmp_file = self.decisions_file.with_suffix(".jsonl.tmp")
+        if is_prefix:
+            self._compact_split(archive_file, tmp_file, split)
+        else:
+            self._compact_rewrite(archive_file, tmp_file, cutoff_str)
 
-            # Save archived to separate file
-            archive_file = self.memory_path / f"decisions-archive-{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
-            with open(archive_file, "a", encoding="utf-8") as f:
-                for decision in archived:
-                    f.write(json.dumps(decision, ensure_ascii=False) + "\n")
+        os.replace(tmp_file, self.decisions_file)
+        self._reset_decision_index()
+        self._invalidate_decisions_cache()
 
         return {
-            "kept": len(kept),
-            "archived": len(archived),
-            "archive_file": str(archive_file) if archived else None
+            "kept": kept,
+            "archived": archived,
+            "archive_file": str(archive_file)
         }
 
+    def _compact_split(self, archive_file: Path, tmp_file: Path, split: Optional[int]) -> None:
+        """Move bytes [0, split) to the archive and the rest to tmp_file, in-kernel."""
+        size = os.path.getsize(self.decisions_file)
+        if split is None:
+            split = size
+
+        # No O_APPEND on the archive: sendfile() rejects append-mode targets
+        archive_fd = os.open(
+            archive_file, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666
+        )
+        with open(self.decisions_file, "rb") as src, \
+                open(archive_fd, "wb", buffering=0) as archive_fp, \
+                open(tmp_file, "wb", buffering=0) as dst:
+            archive_fp.seek(0, os.SEEK_END)
+            _copy_range(src, archive_fp, 0, split)
+            _copy_range(src, dst, split, size - split)
+
+    def _compact_rewrite(self, archive_file: Path, tmp_file: Path, cutoff_str: str) -> None:
+        """Stream lines into tmp_file or the archive, dropping corrupt ones."""
+        with open(tmp_file, "wb") as dst, open(archive_file, "ab") as archive_fp:
+            for _, line in _iter_mapped_lines(self.decisions_file):
+                timestamp = _line_timestamp(line)
+                if timestamp is None:
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+
+                if timestamp >= cutoff_str:
+                    dst.write(line)
+                else:
+                    archive_fp.write(line)
+
     def stats(self) -> dict:
         """Get memory system statistics."""
-        decisions = self.get_all_decisions()
+        # Single streaming pass over the log
+        total_decisions = 0
+        with_outcomes = 0
+        for decision in self._iter_decisions():
+            if decision.get("_type") != "outcome_update":
+                total_decisions += 1
+            if decision.get("outcome") is not None:
+                with_outcomes += 1
+
         performance = self.get_agent_performance()
         patterns = self.get_patterns()
 
         # Count session summaries
-        summaries_dir = self.memory_path / "session-summaries"
-        session_count = len(list(summaries_dir.glob("*.json"))) if summaries_dir.exists() else 0
+        summaries_dir = self.summaries_path
+        session_count = len(self._session_summary_files()) if summaries_dir.exists() else 0
 
         return {
-            "total_decisions": len([d for d in decisions if d.get("_type") != "outcome_update"]),
-            "decisions_with_outcomes": len([d for d in decisions if d.get("outcome") is not None]),
+            "total_decisions": total_decisions,
+            "decisions_with_outcomes": with_outcomes,
             "agents_tracked": len(performance.get("agents", {})),
             "patterns_learned": sum(
                 1 for v in patterns.get("code_style", {}).values() if v is not None
@@ -606,6 +1376,7 @@ def main():
     memory = MemoryManager()
 
     if args.stats:
+        memory.flush_performance()
         stats = memory.stats()
         print("=== Memory System Statistics ===")
         for key, value in stats.items():
@@ -634,6 +1405,7 @@ def main():
         print(json.dumps(patterns, indent=2))
 
     elif args.agents:
+        memory.flush_performance()
         perf = memory.get_agent_performance()
         print(json.dumps(perf, indent=2))
 
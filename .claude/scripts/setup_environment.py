@@ -17,10 +17,16 @@ Supported project types:
 """
 
 import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+# Maximum number of project setups run at the same time
+MAX_SETUP_WORKERS = 4
 
 
 def get_project_root() -> Path:
@@ -30,8 +36,10 @@ def get_project_root() -> Path:
     return script_dir.parent.parent
 
 
-def run_command(cmd: list[str], cwd: Optional[Path] = None, check: bool = False) -> bool:
-    """Run a command and return success status."""
+def run_command(cmd: list[str], cwd: Optional[Path] = None, check: bool = False,
+                lines: Optional[list[str]] = None) -> bool:
+    """Run a command and return success status (output goes to `lines` if given)."""
+    emit = print if lines is None else lines.append
     try:
         result = subprocess.run(
             cmd,
@@ -41,28 +49,49 @@ def run_command(cmd: list[str], cwd: Optional[Path] = None, check: bool = False)
             check=check
         )
         if result.returncode == 0 and result.stdout:
-            print(result.stdout.strip())
+            emit(result.stdout.strip())
         return result.returncode == 0
     except subprocess.CalledProcessError as e:
-        print(f"  Warning: {e.stderr.strip() if e.stderr else str(e)}")
+        emit(f"  Warning: {e.stderr.strip() if e.stderr else str(e)}")
         return False
     except FileNotFoundError:
         return False
 
 
+@cache
+def find_tool(name: str) -> Optional[str]:
+    """Locate an executable on PATH without spawning it (cached)."""
+    return shutil.which(name)
+
+
+# Project type -> marker files in the project root ("*.ext" matches a suffix)
+PROJECT_MARKERS = {
+    "nodejs": ("package.json",),
+    "python_req": ("requirements.txt",),
+    "python_pyproject": ("pyproject.toml",),
+    "python_setup": ("setup.py",),
+    "rust": ("Cargo.toml",),
+    "go": ("go.mod",),
+    "ruby": ("Gemfile",),
+    "php": ("composer.json",),
+    "dotnet": ("*.csproj", "*.sln"),
+    "flutter": ("pubspec.yaml",),
+}
+
+
 def detect_project_type(root: Path) -> dict[str, bool]:
-    """Detect project types based on config files."""
+    """Detect project types based on config files (one directory scan)."""
+    with os.scandir(root) as entries:
+        names = {entry.name for entry in entries}
+
+    def present(marker: str) -> bool:
+        if marker.startswith("*"):
+            return any(name.endswith(marker[1:]) for name in names)
+        return marker in names
+
     return {
-        "nodejs": (root / "package.json").exists(),
-        "python_req": (root / "requirements.txt").exists(),
-        "python_pyproject": (root / "pyproject.toml").exists(),
-        "python_setup": (root / "setup.py").exists(),
-        "rust": (root / "Cargo.toml").exists(),
-        "go": (root / "go.mod").exists(),
-        "ruby": (root / "Gemfile").exists(),
-        "php": (root / "composer.json").exists(),
-        "dotnet": any(root.glob("*.csproj")) or any(root.glob("*.sln")),
-        "flutter": (root / "pubspec.yaml").exists(),
+        ptype: any(present(marker) for marker in markers)
+        for ptype, markers in PROJECT_MARKERS.items()
     }
 
 
@@ -74,40 +103,39 @@ def ensure_logs_dir(root: Path) -> None:
         print("  Created .claude/logs/")
 
 
-def setup_nodejs(root: Path) -> None:
+def setup_nodejs(root: Path) -> list[str]:
     """Setup Node.js project."""
+    lines: list[str] = []
     node_modules = root / "node_modules"
     if node_modules.exists():
-        print("  node_modules/ already exists")
-        return
-
-    # Try package managers in order of preference
-    for pm, install_cmd in [
-        ("pnpm", ["pnpm", "install"]),
-        ("yarn", ["yarn", "install"]),
-        ("bun", ["bun", "install"]),
-        ("npm", ["npm", "install"]),
-    ]:
-        if run_command([pm, "--version"], check=False):
-            print(f"  Installing with {pm}...")
-            if run_command(install_cmd, cwd=root):
-                return
+        lines.append("  node_modules/ already exists")
+        return lines
+
+    # Use the first installed package manager, in order of preference
+    for pm in ("pnpm", "yarn", "bun", "npm"):
+        pm_path = find_tool(pm)
+        if pm_path:
+            lines.append(f"  Installing with {pm}...")
+            if run_command([pm_path, "install"], cwd=root, lines=lines):
+                return lines
             break
 
-    print("  Warning: Could not install Node.js dependencies")
+    lines.append("  Warning: Could not install Node.js dependencies")
+    return lines
 
 
-def setup_python(root: Path, project_types: dict) -> None:
+def setup_python(root: Path, project_types: dict) -> list[str]:
     """Setup Python project."""
+    lines: list[str] = []
     # Check for existing venv
     venv_paths = [root / "venv", root / ".venv", root / "env"]
     venv_exists = any(p.exists() for p in venv_paths)
 
     if not venv_exists:
-        print("  Creating Python virtual environment...")
-        if not run_command([sys.executable, "-m", "venv", "venv"], cwd=root):
-            print("  Warning: Could not create venv")
-            return
+        lines.append("  Creating Python virtual environment...")
+        if not run_command([sys.executable, "-m", "venv", "venv"], cwd=root, lines=lines):
+            lines.append("  Warning: Could not create venv")
+            return lines
 
     # Determine pip path
     if sys.platform == "win32":
@@ -123,69 +151,108 @@ def setup_python(root: Path, project_types: dict) -> None:
 
     pip_path = next((p for p in pip_candidates if p.exists()), None)
     if not pip_path:
-        print("  Warning: pip not found in venv")
-        return
+        lines.append("  Warning: pip not found in venv")
+        return lines
 
     # Install dependencies
     if project_types.get("python_req"):
-        print("  Installing from requirements.txt...")
-        run_command([str(pip_path), "install", "-r", "requirements.txt"], cwd=root)
+        lines.append("  Installing from requirements.txt...")
+        run_command([str(pip_path), "install", "-r", "requirements.txt"], cwd=root, lines=lines)
     elif project_types.get("python_pyproject"):
-        print("  Installing from pyproject.toml...")
-        run_command([str(pip_path), "install", "-e", "."], cwd=root)
+        lines.append("  Installing from pyproject.toml...")
+        run_command([str(pip_path), "install", "-e", "."], cwd=root, lines=lines)
+    return lines
 
 
-def setup_rust(root: Path) -> None:
+def setup_rust(root: Path) -> list[str]:
     """Setup Rust project."""
+    lines: list[str] = []
     target_dir = root / "target"
     if target_dir.exists():
-        print("  Rust target/ already exists")
-        return
+        lines.append("  Rust target/ already exists")
+        return lines
 
-    print("  Running cargo build...")
-    run_command(["cargo", "build"], cwd=root)
+    lines.append("  Running cargo build...")
+    run_command(["cargo", "build"], cwd=root, lines=lines)
+    return lines
 
 
-def setup_go(root: Path) -> None:
+def setup_go(root: Path) -> list[str]:
     """Setup Go project."""
-    print("  Running go mod download...")
-    run_command(["go", "mod", "download"], cwd=root)
+    lines = ["  Running go mod download..."]
+    run_command(["go", "mod", "download"], cwd=root, lines=lines)
+    return lines
 
 
-def setup_ruby(root: Path) -> None:
+def setup_ruby(root: Path) -> list[str]:
     """Setup Ruby project."""
+    lines: list[str] = []
     if (root / "vendor" / "bundle").exists():
-        print("  Ruby gems already installed")
-        return
+        lines.append("  Ruby gems already installed")
+        return lines
 
-    print("  Running bundle install...")
-    run_command(["bundle", "install"], cwd=root)
+    lines.append("  Running bundle install...")
+    run_command(["bundle", "install"], cwd=root, lines=lines)
+    return lines
 
 
-def setup_php(root: Path) -> None:
+def setup_php(root: Path) -> list[str]:
     """Setup PHP project."""
+    lines: list[str] = []
     if (root / "vendor").exists():
-        print("  PHP vendor/ already exists")
-        return
+        lines.append("  PHP vendor/ already exists")
+        return lines
 
-    print("  Running composer install...")
-    run_command(["composer", "install"], cwd=root)
+    lines.append("  Running composer install...")
+    run_command(["composer", "install"], cwd=root, lines=lines)
+    return lines
 
 
-def setup_dotnet(root: Path) -> None:
+def setup_dotnet(root: Path) -> list[str]:
     """Setup .NET project."""
-    print("  Running dotnet restore...")
-    run_command(["dotnet", "restore"], cwd=root)
+    lines = ["  Running dotnet restore..."]
+    run_command(["dotnet", "restore"], cwd=root, lines=lines)
+    return lines
 
 
-def setup_flutter(root: Path) -> None:
+def setup_flutter(root: Path) -> list[str]:
     """Setup Flutter project."""
+    lines: list[str] = []
     if (root / ".dart_tool").exists():
-        print("  Flutter already initialized")
-        return
-
-    print("  Running flutter pub get...")
-    run_command(["flutter", "pub", "get"], cwd=root)
+        lines.append("  Flutter already initialized")
+        return lines
+
+    lines.append("  Running flutter pub get...")
+    run_command(["flutter", "pub", "get"], cwd=root, lines=lines)
+    return lines
+
+
+def run_setup_tasks(tasks: list[tuple[str, Callable[[], list[str]]]]) -> None:
+    """
+    Run independent setup tasks concurrently.
+
+    Package-manager installs are IO-bound external commands, so they overlap
+    well in threads. Each task returns its output lines, printed in task
+    order once it finishes, keeping the log deterministic. The first failed
+    task's exception is re-raised after all tasks have reported.
+    """
+    failure: Optional[Exception] = None
+    with ThreadPoolExecutor(max_workers=MAX_SETUP_WORKERS) as executor:
+        futures = [executor.submit(setup) for _, setup in tasks]
+        for (name, _), future in zip(tasks, futures, strict=True):
+            print(f"[Setup] {name} project")
+            try:
+                lines = future.result()
+            except Exception as e:
+                print(f"  Error: {name} setup failed: {e}")
+                failure = failure or e
+                continue
+            if lines:
+                print("\n".join(lines))
+            sys.stdout.flush()
+
+    if failure is not None:
+        raise failure
 
 
 def main() -> int:
@@ -212,38 +279,33 @@ def main() -> int:
     print(f"[Setup] Detected: {', '.join(detected)}")
     print("-" * 50)
 
-    # Setup each detected type
+    # Collect a setup task for each detected type
+    tasks: list[tuple[str, Callable[[], list[str]]]] = []
     if project_types["nodejs"]:
-        print("[Setup] Node.js project")
-        setup_nodejs(root)
+        tasks.append(("Node.js", lambda: setup_nodejs(root)))
 
     if any(project_types.get(k) for k in ["python_req", "python_pyproject", "python_setup"]):
-        print("[Setup] Python project")
-        setup_python(root, project_types)
+        tasks.append(("Python", lambda: setup_python(root, project_types)))
 
     if project_types["rust"]:
-        print("[Setup] Rust project")
-        setup_rust(root)
+        tasks.append(("Rust", lambda: setup_rust(root)))
 
     if project_types["go"]:
-        print("[Setup] Go project")
-        setup_go(root)
+        tasks.append(("Go", lambda: setup_go(root)))
 
     if project_types["ruby"]:
-        print("[Setup] Ruby project")
-        setup_ruby(root)
+        tasks.append(("Ruby", lambda: setup_ruby(root)))
 
     if project_types["php"]:
-        print("[Setup] PHP project")
-        setup_php(root)
+        tasks.append(("PHP", lambda: setup_php(root)))
 
     if project_types["dotnet"]:
-        print("[Setup] .NET project")
-        setup_dotnet(root)
+        tasks.append((".NET", lambda: setup_dotnet(root)))
 
     if project_types["flutter"]:
-        print("[Setup] Flutter project")
-        setup_flutter(root)
+        tasks.append(("Flutter", lambda: setup_flutter(root)))
+
+    run_setup_tasks(tasks)
 
     print("=" * 50)
     print("[Setup] Done!")
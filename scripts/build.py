@@ -16,7 +16,12 @@ import os
 import sys
 import subprocess
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from importlib import metadata
 from pathlib import Path
+from typing import IO
 
 # Project paths
 ROOT_DIR = Path(__file__).parent.parent
@@ -25,15 +30,42 @@ FRONTEND_DIR = ROOT_DIR / "frontend"
 INSTALLERS_DIR = ROOT_DIR / "installers"
 ASSETS_DIR = INSTALLERS_DIR / "assets"
 
+IS_WINDOWS = os.name == 'nt'
 
-def run_command(cmd: list[str], cwd: Path | None = None, check: bool = True) -> int:
-    """Run a command and return exit code."""
+# Tools probed by check_requirements: (name, version command, required)
+TOOLS = [
+    ("Node.js", ["node", "--version"], True),
+    ("npm", ["npm", "--version"], True),
+    ("GitHub CLI", ["gh", "--version"], False),
+]
+
+
+@cache
+def find_executable(name: str) -> str:
+    """Resolve a tool on PATH once (e.g. npm -> full path of npm.cmd on Windows)."""
+    return shutil.which(name) or name
+
+
+def resolve_command(cmd: list[str]) -> list[str]:
+    """Replace the program name with its resolved path so no shell is needed."""
+    return [find_executable(cmd[0]), *cmd[1:]]
+
+
+def run_command(cmd: list[str] | str, cwd: Path | None = None, check: bool = True) -> int:
+    """Run a command and return exit code.
+
+    Argument lists run directly with inherited stdio; only a command string
+    goes through the shell.
+    """
     print(f"\n{'='*60}")
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: {cmd if isinstance(cmd, str) else ' '.join(cmd)}")
     print(f"In: {cwd or os.getcwd()}")
     print('='*60)
 
-    result = subprocess.run(cmd, cwd=cwd, shell=(os.name == 'nt'))
+    if isinstance(cmd, str):
+        result = subprocess.run(cmd, cwd=cwd, shell=True)
+    else:
+        result = subprocess.run(resolve_command(cmd), cwd=cwd)
 
     if check and result.returncode != 0:
         print(f"Command failed with exit code {result.returncode}")
@@ -42,39 +74,47 @@ def run_command(cmd: list[str], cwd: Path | None = None, check: bool = True) ->
     return result.returncode
 
 
+def probe_tool(cmd: list[str]) -> tuple[int, str]:
+    """Run a tool's version probe and return (exit code, first output line)."""
+    try:
+        result = subprocess.run(resolve_command(cmd), capture_output=True, text=True)
+    except OSError:
+        return -1, ""
+    lines = result.stdout.strip().splitlines()
+    return result.returncode, lines[0] if lines else ""
+
+
 def check_requirements():
     """Check that required tools are installed."""
     print("\nChecking requirements...")
 
-    # Check Python
-    print(f"Python: {sys.version}")
+    # Start all tool probes at once; they are independent process spawns
+    with ThreadPoolExecutor(max_workers=len(TOOLS)) as executor:
+        probes = {name: executor.submit(probe_tool, cmd) for name, cmd, _ in TOOLS}
 
-    # Check PyInstaller
-    try:
-        import PyInstaller
-        print(f"PyInstaller: {PyInstaller.__version__}")
-    except ImportError:
-        print("ERROR: PyInstaller not installed. Run: pip install pyinstaller")
-        sys.exit(1)
-
-    # Check Node.js
-    result = subprocess.run(["node", "--version"], capture_output=True, text=True, shell=(os.name == 'nt'))
-    if result.returncode == 0:
-        print(f"Node.js: {result.stdout.strip()}")
-    else:
-        print("ERROR: Node.js not installed")
-        sys.exit(1)
+        # Check Python
+        print(f"Python: {sys.version}")
 
-    # Check npm
-    result = subprocess.run(["npm", "--version"], capture_output=True, text=True, shell=(os.name == 'nt'))
-    if result.returncode == 0:
-        print(f"npm: {result.stdout.strip()}")
-    else:
-        print("ERROR: npm not installed")
-        sys.exit(1)
+        # Check PyInstaller (package metadata only; importing it is slow)
+        try:
+            print(f"PyInstaller: {metadata.version('pyinstaller')}")
+        except metadata.PackageNotFoundError:
+            print("ERROR: PyInstaller not installed. Run: pip install pyinstaller")
+            sys.exit(1)
+
+        # Check Node.js / npm / GitHub CLI (results reported in TOOLS order)
+        for name, cmd, required in TOOLS:
+            returncode, version = probes[name].result()
+            if returncode == 0:
+                print(f"{name}: {version}")
+            elif required:
+                print(f"ERROR: {name} not installed")
+                sys.exit(1)
+            else:
+                print(f"WARNING: {name} ({cmd[0]}) not found (release upload may fail)")
 
     # Check Inno Setup (Windows only)
-    if os.name == 'nt':
+    if IS_WINDOWS:
         iscc_paths = [
             r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
             r"C:\Program Files\Inno Setup 6\ISCC.exe",
@@ -85,14 +125,6 @@ def check_requirements():
         else:
             print("WARNING: Inno Setup 6 not found (installer build may fail)")
 
-    # Check GitHub CLI
-    result = subprocess.run(["gh", "--version"], capture_output=True, text=True, shell=(os.name == 'nt'))
-    if result.returncode == 0:
-        version = result.stdout.strip().split('\n')[0]
-        print(f"GitHub CLI: {version}")
-    else:
-        print("WARNING: GitHub CLI (gh) not found (release upload may fail)")
-
 
 def convert_svg_to_ico():
     """Convert SVG icon to ICO using Pillow/CairoSVG."""
@@ -107,18 +139,23 @@ def convert_svg_to_ico():
         return
 
     try:
-        import cairosvg
+        from cairosvg.parser import Tree
+        from cairosvg.surface import PNGSurface
         from PIL import Image
         import io
 
-        # Convert SVG to PNG at multiple sizes
+        # Convert SVG to PNG at multiple sizes. The SVG is parsed once and each
+        # size is rendered from that tree (svg2png would re-parse it per size).
         sizes = [16, 32, 48, 64, 128, 256]
-        images = []
+        tree = Tree(url=str(svg_path))
+
+        def rasterize(size: int) -> bytes:
+            output = io.BytesIO()
+            PNGSurface(tree, output, 96, output_width=size, output_height=size).finish()
+            return output.getvalue()
 
-        for size in sizes:
-            png_data = cairosvg.svg2png(url=str(svg_path), output_width=size, output_height=size)
-            img = Image.open(io.BytesIO(png_data))
-            images.append(img)
+        png_sizes = [rasterize(size) for size in sizes]
+        images = [Image.open(io.BytesIO(png_data)) for png_data in png_sizes]
 
         # Save as ICO with multiple sizes
         images[0].save(
@@ -129,10 +166,9 @@ def convert_svg_to_ico():
         )
         print(f"Created: {ico_path}")
 
-        # Also save a PNG for reference
-        png_data = cairosvg.svg2png(url=str(svg_path), output_width=256, output_height=256)
+        # Also save a PNG for reference (the 256px rendering from above)
         with open(png_path, 'wb') as f:
-            f.write(png_data)
+            f.write(png_sizes[sizes.index(256)])
         print(f"Created: {png_path}")
 
     except ImportError as e:
@@ -147,6 +183,25 @@ def convert_svg_to_ico():
             print("ERROR: Pillow not installed. Cannot create icon.")
 
 
+def discard_dir(path: Path, executor: ThreadPoolExecutor) -> None:
+    """Rename a directory out of the way and delete it on the executor."""
+    # Leftovers from an earlier interrupted build
+    for stale in path.parent.glob(f"{path.name}.old-*"):
+        executor.submit(shutil.rmtree, stale, ignore_errors=True)
+
+    if not path.exists():
+        return
+
+    trash = path.with_name(f"{path.name}.old-{os.getpid()}")
+    try:
+        os.replace(path, trash)
+    except OSError:
+        # Rename refused (e.g. across volumes); delete in place
+        shutil.rmtree(path)
+        return
+    executor.submit(shutil.rmtree, trash, ignore_errors=True)
+
+
 def build_backend():
     """Build Python backend with PyInstaller."""
     print("\n" + "="*60)
@@ -159,23 +214,23 @@ def build_backend():
         print(f"ERROR: {spec_file} not found")
         sys.exit(1)
 
-    # Clean previous build
+    # Clean previous build: move the old trees aside and delete them while
+    # PyInstaller runs instead of blocking on rmtree first
     dist_dir = BACKEND_DIR / "dist"
     build_dir = BACKEND_DIR / "build"
 
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
+    with ThreadPoolExecutor(max_workers=2) as cleaner:
+        discard_dir(dist_dir, cleaner)
+        discard_dir(build_dir, cleaner)
 
-    # Run PyInstaller
-    run_command(
-        [sys.executable, "-m", "PyInstaller", "--clean", str(spec_file)],
-        cwd=BACKEND_DIR
-    )
+        # Run PyInstaller
+        run_command(
+            [sys.executable, "-m", "PyInstaller", "--clean", str(spec_file)],
+            cwd=BACKEND_DIR
+        )
 
     # Verify output
-    if os.name == 'nt':
+    if IS_WINDOWS:
         exe_path = dist_dir / "iconhub-backend.exe"
     else:
         exe_path = dist_dir / "iconhub-backend"
@@ -189,7 +244,25 @@ def build_backend():
         sys.exit(1)
 
 
-def build_frontend():
+def start_npm_install() -> tuple[subprocess.Popen, IO[bytes]] | None:
+    """Start `npm install` in the background if node_modules is missing.
+
+    Output goes to a temporary log (replayed by build_frontend) so it does not
+    interleave with whatever runs in the foreground.
+    """
+    if (FRONTEND_DIR / "node_modules").exists():
+        return None
+
+    print("Installing npm dependencies in the background...")
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        resolve_command(["npm", "install"]), cwd=FRONTEND_DIR,
+        stdout=log, stderr=subprocess.STDOUT
+    )
+    return proc, log
+
+
+def build_frontend(npm_install: tuple[subprocess.Popen, IO[bytes]] | None = None):
     """Build Electron frontend."""
     print("\n" + "="*60)
     print("BUILDING FRONTEND")
@@ -197,7 +270,17 @@ def build_frontend():
 
     # Install dependencies if needed
     node_modules = FRONTEND_DIR / "node_modules"
-    if not node_modules.exists():
+    if npm_install is not None:
+        proc, log = npm_install
+        print("Waiting for npm install...")
+        returncode = proc.wait()
+        log.seek(0)
+        sys.stdout.write(log.read().decode(errors="replace"))
+        log.close()
+        if returncode != 0:
+            print(f"npm install failed with exit code {returncode}")
+            sys.exit(returncode)
+    elif not node_modules.exists():
         print("Installing npm dependencies...")
         run_command(["npm", "install"], cwd=FRONTEND_DIR)
 
@@ -208,11 +291,12 @@ def build_frontend():
     output_dir = FRONTEND_DIR / "dist-builder"
     if output_dir.exists():
         print(f"\nFrontend built successfully. Output in: {output_dir}")
-        # List output files
-        for f in output_dir.iterdir():
-            if f.is_file():
-                size_mb = f.stat().st_size / (1024 * 1024)
-                print(f"  {f.name}: {size_mb:.1f} MB")
+        # List output files (DirEntry carries the type, so one stat per file)
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    size_mb = entry.stat().st_size / (1024 * 1024)
+                    print(f"  {entry.name}: {size_mb:.1f} MB")
     else:
         print("WARNING: Output directory not found")
 
@@ -238,16 +322,27 @@ def main():
         print("="*60)
         return
 
-    if not skip_icon:
-        convert_svg_to_ico()
+    # For a full build, install frontend dependencies while the icon and
+    # backend are built; the two stages don't depend on each other
+    npm_install = None
+    if not build_frontend_only and not build_backend_only:
+        npm_install = start_npm_install()
 
-    if build_frontend_only:
-        build_frontend()
-    elif build_backend_only:
-        build_backend()
-    else:
-        build_backend()
-        build_frontend()
+    try:
+        if not skip_icon:
+            convert_svg_to_ico()
+
+        if build_frontend_only:
+            build_frontend()
+        elif build_backend_only:
+            build_backend()
+        else:
+            build_backend()
+            build_frontend(npm_install)
+    finally:
+        # Don't leave npm running if the backend build bailed out
+        if npm_install is not None and npm_install[0].poll() is None:
+            npm_install[0].terminate()
 
     print("\n" + "="*60)
     print("BUILD COMPLETE")
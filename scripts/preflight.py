@@ -34,13 +34,20 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import platform
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from project_cache import cache_dir, load_pyproject
+except ImportError:  # Imported as part of the scripts package (python -m scripts.<tool>, tests)
+    from .project_cache import cache_dir, load_pyproject
 
 # ============================================================================
 # CONSTANTS
@@ -49,6 +56,10 @@ from typing import Dict, List, Optional, Tuple
 SCRIPT_VERSION = "1.0"
 MIN_PYTHON_VERSION = (3, 9)
 
+# Platform facts, computed once
+IS_WINDOWS = os.name == "nt"
+PYTHON_VERSION = sys.version_info[:2]
+
 # Default version files if not configured
 DEFAULT_VERSION_FILES = [
     "pyproject.toml:version",
@@ -59,6 +70,18 @@ DEFAULT_REQUIRED_FILES = [
     "pyproject.toml",
 ]
 
+# Seconds check_git_state waits for the background `git fetch`
+FETCH_TIMEOUT = 5
+
+# Per-entry version cache (in cache_dir): {entry: [mtime_ns, size, version]}
+VERSION_CACHE_FILE = "versions.json"
+
+# Tools probed by check_tools: (display name, command)
+TOOLS = [
+    ("git", ["git", "--version"]),
+    ("gh (GitHub CLI)", ["gh", "--version"]),
+]
+
 
 # ============================================================================
 # COLORS
@@ -78,21 +101,27 @@ class Colors:
     WHITE = "\033[37m"
 
     @classmethod
-    def init(cls) -> None:
-        """Initialize colors (enable ANSI on Windows if possible)."""
-        if platform.system() == "Windows":
+    def init(cls) -> bool:
+        """Initialize colors (enable ANSI on Windows if possible); False if unusable."""
+        # Redirected output (CI logs, pipes) would only show raw escape codes
+        if sys.stdout is None or not sys.stdout.isatty():
+            return False
+        if IS_WINDOWS:
             try:
                 import ctypes
                 kernel32 = ctypes.windll.kernel32
                 kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
             except Exception:
-                for attr in dir(cls):
-                    if not attr.startswith("_") and attr.isupper():
-                        setattr(cls, attr, "")
+                return False
+        return True
+
 
+class _NoColors:
+    """Stand-in for Colors when ANSI codes can't be used: every code is empty."""
+    RESET = BOLD = DIM = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = ""
 
-Colors.init()
-C = Colors()
+
+C = Colors() if Colors.init() else _NoColors()
 
 
 # ============================================================================
@@ -102,6 +131,16 @@ C = Colors()
 class Logger:
     """Logger with quiet mode support."""
 
+    # Level prefixes, formatted once (C is already final at import time)
+    PREFIXES = {
+        "info": f"{C.CYAN}[INFO]{C.RESET}",
+        "ok": f"{C.GREEN}[OK]{C.RESET}",
+        "warn": f"{C.YELLOW}[WARN]{C.RESET}",
+        "error": f"{C.RED}[ERROR]{C.RESET}",
+        "check": f"{C.WHITE}[CHECK]{C.RESET}",
+        "fix": f"{C.MAGENTA}[FIX]{C.RESET}",
+    }
+
     def __init__(self, quiet: bool = False):
         self.quiet = quiet
         self.errors: List[str] = []
@@ -112,15 +151,7 @@ class Logger:
         if self.quiet and level not in ("error", "warn"):
             return
 
-        prefixes = {
-            "info": f"{C.CYAN}[INFO]{C.RESET}",
-            "ok": f"{C.GREEN}[OK]{C.RESET}",
-            "warn": f"{C.YELLOW}[WARN]{C.RESET}",
-            "error": f"{C.RED}[ERROR]{C.RESET}",
-            "check": f"{C.WHITE}[CHECK]{C.RESET}",
-            "fix": f"{C.MAGENTA}[FIX]{C.RESET}",
-        }
-        prefix = prefixes.get(level, prefixes["info"])
+        prefix = self.PREFIXES.get(level, self.PREFIXES["info"])
         print(f"{prefix} {msg}")
 
         if level == "error":
@@ -144,6 +175,27 @@ class Logger:
         print(f"\n{C.YELLOW}--- {title} ---{C.RESET}\n")
 
 
+# ============================================================================
+# FILE CACHE
+# ============================================================================
+
+def _fold_case(name: str) -> str:
+    """Normalize a file name for comparison (Windows paths are case-insensitive)."""
+    return name.lower() if IS_WINDOWS else name
+
+
+@lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file; cached per (path, mtime, size) so edits invalidate it."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def read_text(filepath: Path) -> str:
+    """Read a UTF-8 file, reusing the previous read while it is unchanged."""
+    stat = filepath.stat()
+    return _read_text_cached(str(filepath), stat.st_mtime_ns, stat.st_size)
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -154,6 +206,7 @@ class Config:
     version_files: List[str] = field(default_factory=lambda: DEFAULT_VERSION_FILES.copy())
     required_files: List[str] = field(default_factory=lambda: DEFAULT_REQUIRED_FILES.copy())
     project_root: Path = field(default_factory=Path)
+    pyproject: Dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
     def load(cls, project_root: Optional[Path] = None) -> "Config":
@@ -178,8 +231,7 @@ class Config:
             except ImportError:
                 return cls(project_root=project_root)
 
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = load_pyproject(pyproject_path, tomllib.loads)
 
         # Get preflight config
         preflight = data.get("tool", {}).get("preflight", {})
@@ -188,6 +240,7 @@ class Config:
             version_files=preflight.get("version_files", DEFAULT_VERSION_FILES.copy()),
             required_files=preflight.get("required_files", DEFAULT_REQUIRED_FILES.copy()),
             project_root=project_root,
+            pyproject=data,
         )
 
     def resolve_path(self, path: str) -> Path:
@@ -199,6 +252,33 @@ class Config:
 # VERSION EXTRACTORS
 # ============================================================================
 
+# Version patterns per file kind: (extract, update); {key} is the escaped key
+_VERSION_PATTERNS = {
+    # TOML: version = "x.y.z"
+    "toml": (r'^{key}\s*=\s*"([^"]+)"', r'^({key}\s*=\s*")[^"]+"'),
+    # JSON: "version": "x.y.z" (extraction itself parses the JSON)
+    "json": (r'"{key}"\s*:\s*"([^"]*)"', r'("{key}"\s*:\s*")[^"]*(")'),
+    # Python: __version__ = "x.y.z"
+    "py": (r'^{key}\s*=\s*["\']([^"\']+)["\']', r'^({key}\s*=\s*["\'])[^"\']+(["\'])'),
+    # Inno Setup: #define MyAppVersion "x.y.z"
+    "iss": (r'#define\s+{key}\s+"([^"]+)"', r'(#define\s+{key}\s+")[^"]+(")'),
+    # file_version_info.txt: StringStruct(u'FileVersion', u'x.y.z')
+    "version_info": (r"StringStruct\(u'{key}',\s*u'([^']+)'\)", r"(StringStruct\(u'{key}',\s*u')[^']+(')"),
+}
+
+_BETA_SUFFIX_RE = re.compile(r"-beta\.\d+$")
+_ISS_NUMERIC_RE = re.compile(r'(#define\s+MyAppNumericVersion\s+")[^"]+(")')
+_FILEVERS_RE = re.compile(r"filevers=\([^)]+\)")
+_PRODVERS_RE = re.compile(r"prodvers=\([^)]+\)")
+
+
+@cache
+def _version_re(kind: str, key: str, update: bool = False) -> re.Pattern:
+    """Compiled extract/update pattern for a file kind and key (compiled once)."""
+    template = _VERSION_PATTERNS[kind][1 if update else 0]
+    return re.compile(template.replace("{key}", re.escape(key)), re.MULTILINE)
+
+
 class VersionExtractor:
     """Extracts and updates versions in various file formats."""
 
@@ -208,12 +288,15 @@ class VersionExtractor:
         if not filepath.exists():
             return None
 
-        content = filepath.read_text(encoding="utf-8")
-        suffix = filepath.suffix.lower()
+        return VersionExtractor.extract_from_content(read_text(filepath), key, filepath.name)
+
+    @staticmethod
+    def extract_from_content(content: str, key: str, filename: str) -> Optional[str]:
+        """Extract version from already-read file content."""
+        suffix = Path(filename).suffix.lower()
 
         if suffix == ".toml":
-            # TOML: version = "x.y.z"
-            match = re.search(rf'^{key}\s*=\s*"([^"]+)"', content, re.MULTILINE)
+            match = _version_re("toml", key).search(content)
             return match.group(1) if match else None
 
         elif suffix == ".json":
@@ -225,18 +308,15 @@ class VersionExtractor:
                 return None
 
         elif suffix == ".py":
-            # Python: __version__ = "x.y.z"
-            match = re.search(rf'^{key}\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+            match = _version_re("py", key).search(content)
             return match.group(1) if match else None
 
         elif suffix == ".iss":
-            # Inno Setup: #define MyAppVersion "x.y.z"
-            match = re.search(rf'#define\s+{key}\s+"([^"]+)"', content)
+            match = _version_re("iss", key).search(content)
             return match.group(1) if match else None
 
-        elif suffix == ".txt" and "version_info" in filepath.name.lower():
-            # file_version_info.txt: StringStruct(u'FileVersion', u'x.y.z')
-            match = re.search(rf"StringStruct\(u'{key}',\s*u'([^']+)'\)", content)
+        elif suffix == ".txt" and "version_info" in filename.lower():
+            match = _version_re("version_info", key).search(content)
             return match.group(1) if match else None
 
         return None
@@ -247,68 +327,62 @@ class VersionExtractor:
         if not filepath.exists():
             return False
 
-        content = filepath.read_text(encoding="utf-8")
+        content = read_text(filepath)
         suffix = filepath.suffix.lower()
         new_content = content
 
         if suffix == ".toml":
-            new_content = re.sub(
-                rf'^({key}\s*=\s*")[^"]+"',
+            new_content = _version_re("toml", key, update=True).sub(
                 rf'\g<1>{new_version}"',
-                content,
-                flags=re.MULTILINE
+                content
             )
 
         elif suffix == ".json":
+            # Edit the value in place so the file keeps its formatting; if the
+            # first match wasn't the top-level key, re-serialize instead
+            new_content = _version_re("json", key, update=True).sub(
+                rf'\g<1>{new_version}\g<2>',
+                content,
+                count=1
+            )
             try:
-                data = json.loads(content)
-                if key in data:
-                    data[key] = new_version
-                    new_content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+                if json.loads(new_content).get(key) != new_version:
+                    data = json.loads(content)
+                    new_content = content
+                    if key in data:
+                        data[key] = new_version
+                        new_content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
             except json.JSONDecodeError:
                 return False
 
         elif suffix == ".py":
-            new_content = re.sub(
-                rf'^({key}\s*=\s*["\'])[^"\']+(["\'])',
+            new_content = _version_re("py", key, update=True).sub(
                 rf'\g<1>{new_version}\g<2>',
-                content,
-                flags=re.MULTILINE
+                content
             )
 
         elif suffix == ".iss":
-            new_content = re.sub(
-                rf'(#define\s+{key}\s+")[^"]+(")',
+            new_content = _version_re("iss", key, update=True).sub(
                 rf'\g<1>{new_version}\g<2>',
                 content
             )
             # Also update numeric version if present
-            numeric = re.sub(r"-beta\.\d+$", "", new_version) + ".0"
-            new_content = re.sub(
-                r'(#define\s+MyAppNumericVersion\s+")[^"]+(")',
+            numeric = _BETA_SUFFIX_RE.sub("", new_version) + ".0"
+            new_content = _ISS_NUMERIC_RE.sub(
                 rf'\g<1>{numeric}\g<2>',
                 new_content
             )
 
         elif suffix == ".txt" and "version_info" in filepath.name.lower():
-            new_content = re.sub(
-                rf"(StringStruct\(u'{key}',\s*u')[^']+(')",
+            new_content = _version_re("version_info", key, update=True).sub(
                 rf"\g<1>{new_version}\g<2>",
                 content
             )
             # Also update filevers and prodvers tuples
-            parts = re.sub(r"-beta\.\d+$", "", new_version).split(".")
+            parts = _BETA_SUFFIX_RE.sub("", new_version).split(".")
             ver_tuple = f"({parts[0]}, {parts[1]}, {parts[2]}, 0)"
-            new_content = re.sub(
-                r"filevers=\([^)]+\)",
-                f"filevers={ver_tuple}",
-                new_content
-            )
-            new_content = re.sub(
-                r"prodvers=\([^)]+\)",
-                f"prodvers={ver_tuple}",
-                new_content
-            )
+            new_content = _FILEVERS_RE.sub(f"filevers={ver_tuple}", new_content)
+            new_content = _PRODVERS_RE.sub(f"prodvers={ver_tuple}", new_content)
 
         if new_content != content:
             filepath.write_text(new_content, encoding="utf-8")
@@ -328,11 +402,15 @@ class PreflightChecker:
         self.config = config
         self.log = logger
         self.versions: Dict[str, str] = {}
+        self._fetch_proc: Optional[subprocess.Popen] = None
 
     def run_all(self) -> bool:
         """Run all preflight checks."""
         self.log.header(f"Preflight Checker v{SCRIPT_VERSION}")
 
+        # The fetch is network-bound; let it overlap with the local checks
+        self._start_fetch()
+
         checks = [
             ("Python Version", self.check_python),
             ("Version Consistency", self.check_versions),
@@ -353,7 +431,7 @@ class PreflightChecker:
 
     def check_python(self) -> None:
         """Check Python version."""
-        current = sys.version_info[:2]
+        current = PYTHON_VERSION
         required = MIN_PYTHON_VERSION
 
         self.log.log(f"Python {current[0]}.{current[1]} (required: {required[0]}.{required[1]}+)", "check")
@@ -365,26 +443,50 @@ class PreflightChecker:
 
     def check_versions(self) -> None:
         """Check version consistency across all configured files."""
+        # Only files whose mtime/size differ from the cache are read at all
+        cache = self._load_version_cache()
+        stamps = {}
+        for entry in self.config.version_files:
+            path = entry.split(":")[0]
+            if path not in stamps:
+                stamps[path] = self._file_stamp(path)
+
+        stale = [
+            entry.split(":")[0] for entry in self.config.version_files
+            if stamps[entry.split(":")[0]] is not None
+            and cache.get(entry, [])[:2] != stamps[entry.split(":")[0]]
+        ]
+        contents = self._read_version_files(stale)
+        new_cache: Dict[str, list] = {}
+
         for entry in self.config.version_files:
             parts = entry.split(":")
             if len(parts) != 2:
                 self.log.log(f"Invalid version_files entry: {entry}", "warn")
                 continue
 
-            filepath = self.config.resolve_path(parts[0])
             key = parts[1]
+            stamp = stamps[parts[0]]
+            cached = cache.get(entry, [])
 
-            if not filepath.exists():
+            if stamp is not None and cached[:2] == stamp:
+                version = cached[2]
+            elif contents.get(parts[0]) is not None:
+                version = VersionExtractor.extract_from_content(contents[parts[0]], key, parts[0])
+            else:
                 self.log.log(f"{parts[0]}: NOT FOUND", "warn")
                 continue
 
-            version = VersionExtractor.extract(filepath, key)
+            new_cache[entry] = [*stamp, version]
             if version:
                 self.versions[parts[0]] = version
                 self.log.log(f"{parts[0]}: {version}", "check")
             else:
                 self.log.log(f"{parts[0]}: Could not extract '{key}'", "warn")
 
+        if new_cache != cache:
+            self._save_version_cache(new_cache)
+
         # Check consistency
         unique_versions = set(self.versions.values())
         if len(unique_versions) == 0:
@@ -400,9 +502,20 @@ class PreflightChecker:
 
     def check_required_files(self) -> None:
         """Check that all required files exist."""
+        # Names directly in the project root are answered by one directory scan
+        try:
+            with os.scandir(self.config.project_root) as entries:
+                root_names = {_fold_case(entry.name) for entry in entries}
+        except OSError:
+            root_names = set()
+
         for filepath in self.config.required_files:
-            path = self.config.resolve_path(filepath)
-            if path.exists():
+            if "/" in filepath or "\\" in filepath:
+                found = self.config.resolve_path(filepath).exists()
+            else:
+                found = _fold_case(filepath) in root_names
+
+            if found:
                 self.log.log(f"{filepath}: found", "ok")
             else:
                 self.log.log(f"{filepath}: NOT FOUND", "error")
@@ -411,18 +524,24 @@ class PreflightChecker:
         """Check Git repository state."""
         root = self.config.project_root
 
-        # Check if git repo
-        result = self._run_cmd("git rev-parse --git-dir", cwd=root)
+        # Let the background fetch (started by run_all) settle first
+        self._wait_for_fetch()
+
+        # One `git status -sb --porcelain` answers all three questions: it fails
+        # outside a repository, its first line is the branch/tracking summary
+        # and the remaining lines are the changed files.
+        result = self._run_cmd(["git", "status", "-sb", "--porcelain"], cwd=root)
         if not result[0]:
             self.log.log("Not a git repository", "warn")
             return
 
         self.log.log("Git repository: OK", "ok")
 
+        lines = result[1].rstrip().splitlines()
+        status = lines.pop(0) if lines and lines[0].startswith("## ") else ""
+
         # Check for uncommitted changes
-        result = self._run_cmd("git status --porcelain", cwd=root)
-        if result[0] and result[1].strip():
-            lines = result[1].strip().split("\n")
+        if lines:
             self.log.log(f"Uncommitted changes: {len(lines)} file(s)", "warn")
             for line in lines[:5]:  # Show first 5
                 self.log.log(f"  {line}", "check")
@@ -432,39 +551,41 @@ class PreflightChecker:
             self.log.log("Working tree: clean", "ok")
 
         # Check remote sync
-        result = self._run_cmd("git fetch --dry-run 2>&1", cwd=root)
-        result = self._run_cmd("git status -sb", cwd=root)
-        if result[0]:
-            status = result[1].strip().split("\n")[0]
-            if "ahead" in status:
-                match = re.search(r"ahead (\d+)", status)
-                count = match.group(1) if match else "?"
-                self.log.log(f"Local is ahead of remote by {count} commit(s)", "warn")
-            elif "behind" in status:
-                match = re.search(r"behind (\d+)", status)
-                count = match.group(1) if match else "?"
-                self.log.log(f"Local is behind remote by {count} commit(s)", "warn")
-            else:
-                self.log.log("Remote sync: OK", "ok")
+        if "ahead" in status:
+            match = re.search(r"ahead (\d+)", status)
+            count = match.group(1) if match else "?"
+            self.log.log(f"Local is ahead of remote by {count} commit(s)", "warn")
+        elif "behind" in status:
+            match = re.search(r"behind (\d+)", status)
+            count = match.group(1) if match else "?"
+            self.log.log(f"Local is behind remote by {count} commit(s)", "warn")
+        else:
+            self.log.log("Remote sync: OK", "ok")
 
     def check_tools(self) -> None:
         """Check required tools are available."""
-        tools = [
-            ("git", "git --version"),
-            ("gh (GitHub CLI)", "gh --version"),
-            ("PyInstaller", "python -m PyInstaller --version"),
-        ]
+        # Probes are independent process spawns, so run them all at once
+        with ThreadPoolExecutor(max_workers=len(TOOLS) + 1) as executor:
+            probes = [executor.submit(self._run_cmd, cmd) for _, cmd in TOOLS]
+            gh_auth = executor.submit(self._run_cmd, ["gh", "auth", "status"], merge_stderr=True)
 
-        for name, cmd in tools:
-            result = self._run_cmd(cmd)
+        for (name, _), probe in zip(TOOLS, probes, strict=True):
+            result = probe.result()
             if result[0]:
                 version = result[1].strip().split("\n")[0]
                 self.log.log(f"{name}: {version}", "ok")
             else:
                 self.log.log(f"{name}: NOT FOUND", "warn")
 
+        # PyInstaller: read the installed distribution's metadata instead of
+        # starting an interpreter that imports the package
+        try:
+            self.log.log(f"PyInstaller: {metadata.version('pyinstaller')}", "ok")
+        except metadata.PackageNotFoundError:
+            self.log.log("PyInstaller: NOT FOUND", "warn")
+
         # Check Inno Setup (Windows only)
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             iscc_paths = [
                 r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
                 r"C:\Program Files\Inno Setup 6\ISCC.exe",
@@ -476,7 +597,7 @@ class PreflightChecker:
                 self.log.log("Inno Setup 6: NOT FOUND", "warn")
 
         # Check gh auth
-        result = self._run_cmd("gh auth status 2>&1")
+        result = gh_auth.result()
         if result[0] and "Logged in" in result[1]:
             self.log.log("gh authentication: OK", "ok")
         else:
@@ -486,19 +607,19 @@ class PreflightChecker:
         """Fix version inconsistencies by synchronizing all files."""
         self.log.header("Fix Version Inconsistencies")
 
-        # First, collect current versions
-        for entry in self.config.version_files:
-            parts = entry.split(":")
-            if len(parts) != 2:
-                continue
-
-            filepath = self.config.resolve_path(parts[0])
-            key = parts[1]
+        # First, collect current versions (reusing any check_versions already found)
+        entries = [
+            parts for parts in (entry.split(":") for entry in self.config.version_files)
+            if len(parts) == 2 and parts[0] not in self.versions
+        ]
+        contents = self._read_version_files([parts[0] for parts in entries])
 
-            if filepath.exists():
-                version = VersionExtractor.extract(filepath, key)
+        for path, key in entries:
+            content = contents[path]
+            if content is not None:
+                version = VersionExtractor.extract_from_content(content, key, path)
                 if version:
-                    self.versions[parts[0]] = version
+                    self.versions[path] = version
 
         if not self.versions:
             self.log.log("No version files found", "error")
@@ -553,18 +674,97 @@ class PreflightChecker:
                 return VersionExtractor.extract(filepath, parts[1])
         return None
 
-    def _run_cmd(self, cmd: str, cwd: Optional[Path] = None) -> Tuple[bool, str]:
-        """Run a command and return (success, output)."""
+    def _start_fetch(self) -> None:
+        """Start `git fetch --dry-run` in the background."""
+        try:
+            self._fetch_proc = subprocess.Popen(
+                ["git", "fetch", "--dry-run"],
+                cwd=self.config.project_root,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._fetch_proc = None
+
+    def _wait_for_fetch(self) -> None:
+        """Wait (bounded) for the background fetch started by run_all."""
+        if self._fetch_proc is None:
+            return
+        try:
+            self._fetch_proc.wait(timeout=FETCH_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self._fetch_proc.kill()
+            self._fetch_proc.wait()
+        self._fetch_proc = None
+
+    def _file_stamp(self, path: str) -> Optional[List[int]]:
+        """[mtime_ns, size] of a project file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(self.config.resolve_path(path))
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_version_cache(self) -> Dict[str, list]:
+        """Load the version cache (empty if missing or unreadable)."""
+        directory = cache_dir(self.config.project_root)
+        if directory is None:
+            return {}
+        try:
+            data = json.loads((directory / VERSION_CACHE_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, list) and len(v) == 3}
+
+    def _save_version_cache(self, cache: Dict[str, list]) -> None:
+        """Write the version cache atomically (best effort)."""
+        directory = cache_dir(self.config.project_root)
+        if directory is None:
+            return
+        cache_path = directory / VERSION_CACHE_FILE
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            directory.mkdir(exist_ok=True)
+            tmp_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _read_version_files(self, paths: List[str]) -> Dict[str, Optional[str]]:
+        """Read version files concurrently; maps each path to its text (None if missing)."""
+        unique = list(dict.fromkeys(paths))
+
+        def read(path: str) -> Optional[str]:
+            try:
+                return read_text(self.config.resolve_path(path))
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(len(unique), 1)) as executor:
+            return dict(zip(unique, executor.map(read, unique), strict=True))
+
+    def _run_cmd(
+        self, cmd: List[str], cwd: Optional[Path] = None, merge_stderr: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        Run a command (argument list, no shell) and return (success, output).
+
+        Output is stdout only, unless merge_stderr folds stderr into the same
+        pipe (the argv equivalent of `2>&1`).
+        """
         try:
             result = subprocess.run(
                 cmd,
-                shell=True,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
                 text=True,
                 encoding="utf-8",
                 cwd=cwd,
             )
-            return result.returncode == 0, result.stdout + result.stderr
+            return result.returncode == 0, result.stdout
         except Exception as e:
             return False, str(e)
 
@@ -644,10 +844,35 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _quick_version_from_pyproject() -> Optional[str]:
+    """Read the version for --version from pyproject.toml alone, without parsing it.
+
+    Returns None when that isn't enough (no pyproject.toml, no version, or a
+    [tool.preflight] table that may point elsewhere); main() then falls back
+    to the full configuration.
+    """
+    cwd = Path.cwd()
+    root = next((p for p in (cwd, *cwd.parents) if (p / "pyproject.toml").is_file()), None)
+    if root is None:
+        return None
+
+    content = read_text(root / "pyproject.toml")
+    if "[tool.preflight]" in content:
+        return None
+    return VersionExtractor.extract_from_content(content, "version", "pyproject.toml")
+
+
 def main() -> None:
     """Main entry point."""
     args = parse_args()
 
+    # Version mode: the default config only needs pyproject.toml's version line
+    if args.version:
+        version = _quick_version_from_pyproject()
+        if version:
+            print(version)
+            sys.exit(0)
+
     try:
         config = Config.load()
     except Exception as e:
@@ -0,0 +1,100 @@
+"""
+Shared on-disk caches for the release tooling (preflight.py, release.py).
+
+Caches live in <git dir>/preflight so they never show up as uncommitted
+changes in the project being checked or released. Outside a git repository
+nothing is cached.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Directory (inside the git dir) holding all tool caches
+CACHE_DIR_NAME = "preflight"
+
+# Parsed pyproject.toml: pyproject.<mtime_ns>.<size>.pkl, newest
+# PYPROJECT_CACHE_KEEP entries kept
+PYPROJECT_CACHE_KEEP = 3
+
+
+# ============================================================================
+# CACHE DIRECTORY
+# ============================================================================
+
+@cache
+def cache_dir(project_root: Path) -> Optional[Path]:
+    """Cache directory inside the repository's git dir (None outside a git repo)."""
+    root = project_root.absolute()
+    for parent in [root, *root.parents]:
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git / CACHE_DIR_NAME
+        if dot_git.is_file():
+            # Worktree or submodule: ".git" holds "gitdir: <path>"
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            return parent / content[len("gitdir:"):].strip() / CACHE_DIR_NAME
+    return None
+
+
+# ============================================================================
+# PYPROJECT.TOML
+# ============================================================================
+
+def load_pyproject(pyproject_path: Path, loads: Callable[[str], Dict[str, Any]],
+                   write_cache: bool = True) -> Dict[str, Any]:
+    """Parse pyproject.toml with `loads`, reusing the pickled copy if the file is unchanged."""
+    stat = pyproject_path.stat()
+    directory = cache_dir(pyproject_path.parent)
+    cache_file = directory / f"pyproject.{stat.st_mtime_ns}.{stat.st_size}.pkl" if directory else None
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Corrupt or foreign pickle (unpickling can raise almost anything);
+            # the cache is disposable, so drop it and parse the file
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+    data = loads(pyproject_path.read_text(encoding="utf-8"))
+    if cache_file is not None and write_cache:
+        _store(cache_file, data)
+    return data
+
+
+def _store(cache_file: Path, data: Dict[str, Any]) -> None:
+    """Pickle parsed pyproject.toml atomically and drop stale entries (best effort)."""
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+        entries = sorted(
+            cache_file.parent.glob("pyproject.*.pkl"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[PYPROJECT_CACHE_KEEP:]:
+            stale.unlink()
+    except OSError:
+        pass
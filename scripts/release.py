@@ -38,19 +38,30 @@ Configuration:
 from __future__ import annotations
 
 import argparse
-import base64
-import hashlib
 import os
-import platform
 import re
-import shutil
 import subprocess
 import sys
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from project_cache import load_pyproject
+except ImportError:  # Imported as part of the scripts package (python -m scripts.<tool>, tests)
+    from .project_cache import load_pyproject
+
+try:
+    import tomllib as _tomllib
+except ImportError:
+    try:
+        import tomli as _tomllib  # type: ignore[no-redef]
+    except ImportError:
+        _tomllib = None  # reported by Config.load / --check
 
 # ============================================================================
 # CONSTANTS
@@ -76,6 +87,31 @@ OPTIONAL_PACKAGES = {
     "tomli": "tomli (for Python < 3.11)",
 }
 
+# Version formats (x.y.z and x.y.z-beta.n)
+_STABLE_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_BETA_RE = re.compile(r"^\d+\.\d+\.\d+-beta\.\d+$")
+
+# Version lines rewritten by step2_update_versions
+_PYPROJECT_VER_RE = re.compile(r'^version = ".*"$', re.MULTILINE)
+_ISS_VER_RE = re.compile(r'#define MyAppVersion ".*"')
+_ISS_NUMVER_RE = re.compile(r'#define MyAppNumericVersion ".*"')
+_FILEVERS_RE = re.compile(r"filevers=\(\d+, \d+, \d+, \d+\)")
+_PRODVERS_RE = re.compile(r"prodvers=\(\d+, \d+, \d+, \d+\)")
+_FV_STRUCT_RE = re.compile(r"StringStruct\(u'FileVersion', u'.*'\)")
+_PV_STRUCT_RE = re.compile(r"StringStruct\(u'ProductVersion', u'.*'\)")
+_PKG_VER_RE = re.compile(r'("version"\s*:\s*")[^"]*(")')
+
+# "Token scopes: 'gist', 'repo', ..." line of `gh auth status`
+_TOKEN_SCOPES_RE = re.compile(r"Token scopes?:\s*([^\n]+)")
+
+# GitHub write requests (release, asset uploads, yml pushes): minimum gap
+# between request starts and retries with exponential backoff when gh reports
+# a (secondary) rate limit
+GH_MUTATION_GAP = 1.0
+GH_RETRY_DELAY = 5.0
+GH_MAX_RETRIES = 5
+_GH_RATE_LIMIT_RE = re.compile(r"rate limit|HTTP 429", re.IGNORECASE)
+
 
 # ============================================================================
 # COLORS
@@ -94,43 +130,68 @@ class Colors:
     CYAN = "\033[36m"
     WHITE = "\033[37m"
 
-    # Disable colors on Windows without ANSI support
+    _initialized = False
+
+    # Disable colors when not writing to a terminal or without ANSI support
     @classmethod
     def init(cls) -> None:
         """Initialize colors (enable ANSI on Windows if possible)."""
-        if platform.system() == "Windows":
+        if cls._initialized:
+            return
+        cls._initialized = True
+
+        if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+            cls._disable()
+            return
+
+        # Windows Terminal and ANSICON already interpret ANSI codes
+        if os.name == "nt" and not (os.environ.get("WT_SESSION") or os.environ.get("ANSICON")):
             try:
                 import ctypes
                 kernel32 = ctypes.windll.kernel32
                 kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
             except Exception:
                 # Disable colors if ANSI not supported
-                for attr in dir(cls):
-                    if not attr.startswith("_") and attr.isupper():
-                        setattr(cls, attr, "")
+                cls._disable()
+
+    @classmethod
+    def _disable(cls) -> None:
+        """Blank out all color codes."""
+        for attr in _COLOR_ATTRS:
+            setattr(cls, attr, "")
+
+
+_COLOR_ATTRS = ("RESET", "BOLD", "DIM", "RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "WHITE")
 
 
 Colors.init()
-C = Colors()
+C = Colors
 
 
 # ============================================================================
 # LOGGING
 # ============================================================================
 
+# Built once, after Colors.init() has settled the color codes
+_LOG_PREFIXES = {
+    "info": f"{C.CYAN}[INFO]{C.RESET}",
+    "ok": f"{C.GREEN}[OK]{C.RESET}",
+    "warn": f"{C.YELLOW}[WARN]{C.RESET}",
+    "error": f"{C.RED}[ERROR]{C.RESET}",
+    "step": f"{C.MAGENTA}[STEP]{C.RESET}",
+    "dry": f"{C.BLUE}[DRY]{C.RESET}",
+    "check": f"{C.WHITE}[CHECK]{C.RESET}",
+}
+
+
+def format_log(msg: str, level: str = "info") -> str:
+    """Return the line log() would print."""
+    return f"{_LOG_PREFIXES.get(level, _LOG_PREFIXES['info'])} {msg}"
+
+
 def log(msg: str, level: str = "info") -> None:
     """Print a colored log message."""
-    prefixes = {
-        "info": f"{C.CYAN}[INFO]{C.RESET}",
-        "ok": f"{C.GREEN}[OK]{C.RESET}",
-        "warn": f"{C.YELLOW}[WARN]{C.RESET}",
-        "error": f"{C.RED}[ERROR]{C.RESET}",
-        "step": f"{C.MAGENTA}[STEP]{C.RESET}",
-        "dry": f"{C.BLUE}[DRY]{C.RESET}",
-        "check": f"{C.WHITE}[CHECK]{C.RESET}",
-    }
-    prefix = prefixes.get(level, prefixes["info"])
-    print(f"{prefix} {msg}")
+    print(format_log(msg, level))
 
 
 def header(title: str) -> None:
@@ -179,15 +240,15 @@ class Config:
     project_root: Path = field(default_factory=Path)
 
     @classmethod
-    def load(cls, project_root: Optional[Path] = None) -> "Config":
+    def load(cls, project_root: Optional[Path] = None, write_cache: bool = True) -> "Config":
         """Load configuration from pyproject.toml."""
         if project_root is None:
-            # Find project root (directory containing pyproject.toml)
-            project_root = Path.cwd()
-            for parent in [project_root] + list(project_root.parents):
-                if (parent / "pyproject.toml").exists():
-                    project_root = parent
-                    break
+            # Find project root (nearest directory containing pyproject.toml)
+            cwd = Path.cwd()
+            project_root = next(
+                (p for p in (cwd, *cwd.parents) if (p / "pyproject.toml").is_file()),
+                cwd,
+            )
 
         pyproject_path = project_root / "pyproject.toml"
         if not pyproject_path.exists():
@@ -197,19 +258,13 @@ class Config:
             )
 
         # Load pyproject.toml
-        try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                raise ImportError(
-                    "tomli package required for Python < 3.11\n"
-                    "Install with: pip install tomli"
-                )
+        if _tomllib is None:
+            raise ImportError(
+                "tomli package required for Python < 3.11\n"
+                "Install with: pip install tomli"
+            )
 
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = load_pyproject(pyproject_path, _tomllib.loads, write_cache)
 
         # Get project info
         project = data.get("project", {})
@@ -237,30 +292,30 @@ class Config:
             ""
         )
 
-        # Create config
-        config = cls(
-            app_name=app_name,
-            releases_repo=releases_repo,
-            current_version=current_version,
-            project_root=project_root,
-        )
-
-        # Override with custom values from config
+        # Custom values from config override the field defaults
         configurable_paths = [
             "pyproject_toml", "installer_iss", "version_info", "init_file",
             "release_dir", "dist_dir", "latest_yml", "beta_yml",
             "installer_name", "spec_file", "package_json", "build_method",
             "frontend_dir"
         ]
+        overrides = {key: release_config[key] for key in configurable_paths if key in release_config}
 
-        for key in configurable_paths:
-            if key in release_config:
-                setattr(config, key, release_config[key])
+        # Create config
+        config = cls(
+            app_name=app_name,
+            releases_repo=releases_repo,
+            current_version=current_version,
+            project_root=project_root,
+            **overrides,
+        )
 
         # Replace {app_name} placeholder in paths
-        for attr in ["installer_iss", "installer_name", "spec_file", "init_file"]:
+        app_lower = app_name.lower()
+        for attr in ("installer_iss", "installer_name", "spec_file", "init_file"):
             value = getattr(config, attr)
-            setattr(config, attr, value.replace("{app_name}", app_name.lower()))
+            if "{app_name}" in value:
+                setattr(config, attr, value.replace("{app_name}", app_lower))
 
         return config
 
@@ -275,9 +330,7 @@ class Config:
 
 def validate_version(version: str) -> bool:
     """Validate version format (x.y.z or x.y.z-beta.n)."""
-    stable_pattern = r"^\d+\.\d+\.\d+$"
-    beta_pattern = r"^\d+\.\d+\.\d+-beta\.\d+$"
-    return bool(re.match(stable_pattern, version) or re.match(beta_pattern, version))
+    return bool(_STABLE_RE.match(version) or _BETA_RE.match(version))
 
 
 def is_beta(version: str) -> bool:
@@ -287,20 +340,23 @@ def is_beta(version: str) -> bool:
 
 def to_numeric_version(version: str) -> str:
     """Convert version to numeric format (x.y.z.0)."""
-    base = re.sub(r"-beta\.\d+$", "", version)
-    return f"{base}.0"
+    return f"{version.partition('-beta')[0]}.0"
 
 
 def to_file_version_tuple(version: str) -> Tuple[int, int, int, int]:
     """Convert version to tuple for file_version_info.txt."""
-    base = re.sub(r"-beta\.\d+$", "", version)
-    parts = base.split(".")
-    return (int(parts[0]), int(parts[1]), int(parts[2]), 0)
+    major, minor, patch = version.partition("-beta")[0].split(".")
+    return (int(major), int(minor), int(patch), 0)
 
 
 def run(cmd: str, silent: bool = False, ignore_error: bool = False,
-        dry_run: bool = False, cwd: Optional[Path] = None) -> Tuple[bool, str]:
-    """Execute a shell command."""
+        dry_run: bool = False, cwd: Optional[Path] = None,
+        capture: bool = True, input: Optional[str] = None) -> Tuple[bool, str]:
+    """Execute a shell command.
+
+    With capture=False the output is discarded and only the exit status is
+    reported, for yes/no probes. `input` is passed to the command's stdin.
+    """
     if dry_run:
         log(f"Would run: {cmd}", "dry")
         return True, ""
@@ -308,10 +364,55 @@ def run(cmd: str, silent: bool = False, ignore_error: bool = False,
     if not silent:
         log(f"Running: {cmd}", "info")
 
+    if not capture:
+        try:
+            result = subprocess.run(
+                cmd,
+                shell=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=cwd,
+            )
+        except Exception as e:
+            if not ignore_error:
+                log(f"Error: {e}", "error")
+            return False, str(e)
+        return result.returncode == 0, ""
+
     try:
         result = subprocess.run(
             cmd,
             shell=True,
+            input=input,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=cwd,
+        )
+        stdout = result.stdout or ""
+        stderr = result.stderr or ""
+
+        if result.returncode != 0 and not ignore_error:
+            if not silent:
+                log(f"Command failed: {stderr}", "error")
+            return False, stderr
+        return True, stdout
+    except Exception as e:
+        if not ignore_error:
+            log(f"Error: {e}", "error")
+        return False, str(e)
+
+
+def run_argv(argv: List[str], silent: bool = False, ignore_error: bool = False,
+             cwd: Optional[Path] = None) -> Tuple[bool, str]:
+    """Execute a command from an argument list, without a shell."""
+    cmd = " ".join(argv)
+    if not silent:
+        log(f"Running: {cmd}", "info")
+
+    try:
+        result = subprocess.run(
+            argv,
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -331,18 +432,63 @@ def run(cmd: str, silent: bool = False, ignore_error: bool = False,
         return False, str(e)
 
 
-def sha512_file(filepath: Path) -> str:
-    """Calculate SHA512 hash of a file (base64 encoded)."""
-    sha = hashlib.sha512()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha.update(chunk)
-    return base64.b64encode(sha.digest()).decode("utf-8")
+def sha512_and_size(filepath: Path) -> Tuple[str, int]:
+    """Calculate SHA512 hash (base64 encoded) and size of a file in one pass."""
+    # Only release builds hash files; keep these out of --check startup
+    import base64
+    import hashlib
+    import mmap
+
+    with open(filepath, "rb", buffering=0) as f:
+        # Hash the whole mapped file in one C call; mmap refuses empty files
+        # and some network shares, which fall through to streamed reads
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                digest = hashlib.sha512(mm).digest()
+                size = len(mm)
+            return base64.b64encode(digest).decode("utf-8"), size
+        except (OSError, ValueError):
+            pass
+
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: read loop runs in C; it stops at EOF
+            digest = hashlib.file_digest(f, "sha512").digest()
+            size = f.tell()
+        else:
+            # Reuse one 4 MiB buffer instead of allocating a bytes per chunk
+            sha = hashlib.sha512()
+            buffer = bytearray(4 << 20)
+            view = memoryview(buffer)
+            size = 0
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha.update(view[:n])
+                size += n
+            digest = sha.digest()
+    return base64.b64encode(digest).decode("utf-8"), size
 
 
-def file_size(filepath: Path) -> int:
-    """Get file size in bytes."""
-    return filepath.stat().st_size
+def existing_files(root: Path, files: List[str]) -> Set[str]:
+    """Return which of `files` (relative to root) exist, reading each parent directory once."""
+    listings: Dict[Path, Set[str]] = {}
+    found: Set[str] = set()
+
+    for file in files:
+        path = root / file
+        if path.parent not in listings:
+            try:
+                with os.scandir(path.parent) as entries:
+                    listings[path.parent] = {os.path.normcase(e.name) for e in entries}
+            except OSError:
+                listings[path.parent] = set()
+        if os.path.normcase(path.name) in listings[path.parent]:
+            found.add(file)
+
+    return found
 
 
 def prompt(question: str) -> str:
@@ -350,31 +496,38 @@ def prompt(question: str) -> str:
     return input(question).strip().lower()
 
 
-def check_command(cmd: str, name: str) -> Tuple[bool, str]:
+def check_command(argv: List[str], name: str) -> Tuple[bool, str]:
     """Check if a command is available."""
-    success, output = run(cmd, silent=True, ignore_error=True)
-    return success, output
+    return _probe_command(tuple(argv))
 
 
-def find_executable(name: str, paths: List[str]) -> Optional[str]:
-    """Find executable in given paths or PATH."""
-    # Check PATH first
-    success, _ = run(f"where {name}", silent=True, ignore_error=True)
-    if success:
-        return name
+@lru_cache(maxsize=64)
+def _probe_command(argv: Tuple[str, ...]) -> Tuple[bool, str]:
+    """Run a probe command once per process and remember its result."""
+    return run_argv(list(argv), silent=True, ignore_error=True)
+
 
-    # Check specific paths
-    for path in paths:
-        if Path(path).exists():
-            return f'"{path}"'
+@cache
+def _which(name: str) -> Optional[str]:
+    """Locate an executable on PATH (cached per name)."""
+    import shutil
+    return shutil.which(name)
 
-    return None
+
+def find_executable(name: str, paths: List[str]) -> Optional[str]:
+    """Find executable in PATH or given paths."""
+    # PATH lookup is a pure-Python scan; no `where` subprocess needed
+    return _which(name) or next((p for p in paths if os.path.exists(p)), None)
 
 
 # ============================================================================
 # ENVIRONMENT CHECKER
 # ============================================================================
 
+# Result of one environment check: (errors, warnings, info, log_lines)
+CheckResult = Tuple[List[str], List[str], List[str], List[str]]
+
+
 class EnvironmentChecker:
     """Checks if all requirements are met for release."""
 
@@ -401,135 +554,156 @@ class EnvironmentChecker:
             ("Releases Repository", self.check_releases_repo),
         ]
 
-        for name, check_fn in checks:
+        # The checks are independent and mostly wait on subprocesses (git, gh,
+        # PyInstaller), so run them concurrently. Each returns its findings and
+        # output instead of printing; they are merged and printed in order.
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check_fn) for _, check_fn in checks]
+
+        for (name, _), future in zip(checks, futures, strict=True):
             subheader(name)
             try:
-                check_fn()
+                errors, warnings, info, lines = future.result()
             except Exception as e:
-                self.errors.append(f"{name}: {e}")
+                errors, warnings, info, lines = [f"{name}: {e}"], [], [], []
+            if lines:
+                print("\n".join(lines))
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            self.info.extend(info)
 
         # Summary
         self._print_summary()
 
         return len(self.errors) == 0
 
-    def check_python(self) -> None:
+    def check_python(self) -> CheckResult:
         """Check Python version."""
+        errors: List[str] = []
         current = sys.version_info[:2]
         required = MIN_PYTHON_VERSION
 
-        log(f"Current: Python {current[0]}.{current[1]}", "check")
-        log(f"Required: Python {required[0]}.{required[1]}+", "check")
+        lines = [
+            format_log(f"Current: Python {current[0]}.{current[1]}", "check"),
+            format_log(f"Required: Python {required[0]}.{required[1]}+", "check"),
+        ]
 
         if current >= required:
-            log(f"Python version OK", "ok")
+            lines.append(format_log("Python version OK", "ok"))
         else:
-            self.errors.append(
+            errors.append(
                 f"Python {required[0]}.{required[1]}+ required, "
                 f"but you have {current[0]}.{current[1]}"
             )
+        return errors, [], [], lines
 
-    def check_packages(self) -> None:
+    def check_packages(self) -> CheckResult:
         """Check required Python packages."""
         import importlib
 
+        errors: List[str] = []
+        lines: List[str] = []
+
         # Check required packages
         for package, display_name in REQUIRED_PACKAGES.items():
             try:
                 importlib.import_module(package.replace("-", "_"))
-                log(f"{display_name}: installed", "ok")
+                lines.append(format_log(f"{display_name}: installed", "ok"))
             except ImportError:
-                self.errors.append(f"Package '{package}' not installed. Run: pip install {package}")
-                log(f"{display_name}: NOT FOUND", "error")
+                errors.append(f"Package '{package}' not installed. Run: pip install {package}")
+                lines.append(format_log(f"{display_name}: NOT FOUND", "error"))
 
         # Check optional packages
         if sys.version_info < (3, 11):
             for package, display_name in OPTIONAL_PACKAGES.items():
                 try:
                     importlib.import_module(package)
-                    log(f"{display_name}: installed", "ok")
+                    lines.append(format_log(f"{display_name}: installed", "ok"))
                 except ImportError:
-                    self.errors.append(f"Package '{package}' required for Python < 3.11. Run: pip install {package}")
-                    log(f"{display_name}: NOT FOUND (required for Python < 3.11)", "error")
+                    errors.append(f"Package '{package}' required for Python < 3.11. Run: pip install {package}")
+                    lines.append(format_log(f"{display_name}: NOT FOUND (required for Python < 3.11)", "error"))
         else:
-            log("tomllib: built-in (Python 3.11+)", "ok")
+            lines.append(format_log("tomllib: built-in (Python 3.11+)", "ok"))
+        return errors, [], [], lines
 
-    def check_git(self) -> None:
+    def check_git(self) -> CheckResult:
         """Check Git installation."""
-        success, output = check_command("git --version", "Git")
+        success, output = check_command(["git", "--version"], "Git")
         if success:
             version = output.strip().split()[-1] if output else "unknown"
-            log(f"Git version: {version}", "ok")
-        else:
-            self.errors.append("Git is not installed or not in PATH")
-            log("Git: NOT FOUND", "error")
-            print(f"\n{C.YELLOW}Install Git:{C.RESET}")
-            print("  Windows: https://git-scm.com/download/win")
-            print("  Or: winget install Git.Git")
+            return [], [], [], [format_log(f"Git version: {version}", "ok")]
 
-    def check_gh_cli(self) -> None:
+        return ["Git is not installed or not in PATH"], [], [], [
+            format_log("Git: NOT FOUND", "error"),
+            f"\n{C.YELLOW}Install Git:{C.RESET}",
+            "  Windows: https://git-scm.com/download/win",
+            "  Or: winget install Git.Git",
+        ]
+
+    def check_gh_cli(self) -> CheckResult:
         """Check GitHub CLI installation and authentication."""
         # Check if installed
-        success, output = check_command("gh --version", "GitHub CLI")
+        success, output = check_command(["gh", "--version"], "GitHub CLI")
         if not success:
-            self.errors.append("GitHub CLI (gh) is not installed")
-            log("GitHub CLI: NOT FOUND", "error")
-            print(f"\n{C.YELLOW}Install GitHub CLI:{C.RESET}")
-            print("  Windows: winget install GitHub.cli")
-            print("  Or: https://cli.github.com/")
-            return
+            return ["GitHub CLI (gh) is not installed"], [], [], [
+                format_log("GitHub CLI: NOT FOUND", "error"),
+                f"\n{C.YELLOW}Install GitHub CLI:{C.RESET}",
+                "  Windows: winget install GitHub.cli",
+                "  Or: https://cli.github.com/",
+            ]
 
         version = output.strip().split()[2] if output else "unknown"
-        log(f"GitHub CLI version: {version}", "ok")
+        lines = [format_log(f"GitHub CLI version: {version}", "ok")]
 
         # Check authentication
-        success, auth_output = check_command("gh auth status", "gh auth")
+        success, auth_output = check_command(["gh", "auth", "status"], "gh auth")
         if not success:
-            self.errors.append("GitHub CLI not authenticated. Run: gh auth login")
-            log("GitHub CLI: NOT AUTHENTICATED", "error")
-            print(f"\n{C.YELLOW}Authenticate GitHub CLI:{C.RESET}")
-            print("  gh auth login")
-            return
+            lines += [
+                format_log("GitHub CLI: NOT AUTHENTICATED", "error"),
+                f"\n{C.YELLOW}Authenticate GitHub CLI:{C.RESET}",
+                "  gh auth login",
+            ]
+            return ["GitHub CLI not authenticated. Run: gh auth login"], [], [], lines
 
-        log("GitHub CLI: authenticated", "ok")
+        lines.append(format_log("GitHub CLI: authenticated", "ok"))
 
         # Check scopes
-        required_scopes = ["repo", "workflow"]
-        missing_scopes = []
-        for scope in required_scopes:
-            if scope not in auth_output:
-                missing_scopes.append(scope)
-
-        if missing_scopes:
-            self.warnings.append(f"Missing GitHub scopes: {', '.join(missing_scopes)}")
-            log(f"Missing scopes: {', '.join(missing_scopes)}", "warn")
-            print(f"\n{C.YELLOW}Add missing scopes:{C.RESET}")
-            print(f"  gh auth refresh -h github.com -s {','.join(missing_scopes)}")
-        else:
-            log("GitHub CLI scopes: OK", "ok")
+        required_scopes = {"repo", "workflow"}
+        match = _TOKEN_SCOPES_RE.search(auth_output)
+        granted = {scope.strip().strip("'\"") for scope in match.group(1).split(",")} if match else set()
+        missing_scopes = sorted(required_scopes - granted)
+
+        if not missing_scopes:
+            lines.append(format_log("GitHub CLI scopes: OK", "ok"))
+            return [], [], [], lines
+
+        lines += [
+            format_log(f"Missing scopes: {', '.join(missing_scopes)}", "warn"),
+            f"\n{C.YELLOW}Add missing scopes:{C.RESET}",
+            f"  gh auth refresh -h github.com -s {','.join(missing_scopes)}",
+        ]
+        return [], [f"Missing GitHub scopes: {', '.join(missing_scopes)}"], [], lines
 
-    def check_pyinstaller(self) -> None:
+    def check_pyinstaller(self) -> CheckResult:
         """Check PyInstaller installation."""
-        success, output = check_command("python -m PyInstaller --version", "PyInstaller")
+        success, output = check_command(["python", "-m", "PyInstaller", "--version"], "PyInstaller")
         if success:
             version = output.strip() if output else "unknown"
-            log(f"PyInstaller version: {version}", "ok")
-        else:
-            self.errors.append("PyInstaller not installed. Run: pip install pyinstaller")
-            log("PyInstaller: NOT FOUND", "error")
+            return [], [], [], [format_log(f"PyInstaller version: {version}", "ok")]
+        return (["PyInstaller not installed. Run: pip install pyinstaller"], [], [],
+                [format_log("PyInstaller: NOT FOUND", "error")])
 
-    def check_inno_setup(self) -> None:
+    def check_inno_setup(self) -> CheckResult:
         """Check Inno Setup installation (only for innosetup build method)."""
         if self.config.build_method == "electron":
-            log("Inno Setup: skipped (using electron-builder)", "ok")
+            lines = [format_log("Inno Setup: skipped (using electron-builder)", "ok")]
             # Check npm instead
             frontend_dir = self.config.resolve_path(self.config.frontend_dir)
             if (frontend_dir / "package.json").exists():
-                log(f"electron-builder: package.json found in {self.config.frontend_dir}", "ok")
-            else:
-                self.errors.append(f"package.json not found in {self.config.frontend_dir}")
-                log(f"electron-builder: package.json NOT FOUND", "error")
-            return
+                lines.append(format_log(f"electron-builder: package.json found in {self.config.frontend_dir}", "ok"))
+                return [], [], [], lines
+            lines.append(format_log("electron-builder: package.json NOT FOUND", "error"))
+            return [f"package.json not found in {self.config.frontend_dir}"], [], [], lines
 
         iscc_paths = [
             "ISCC.exe",
@@ -540,92 +714,99 @@ class EnvironmentChecker:
 
         iscc = find_executable("ISCC.exe", iscc_paths[1:])
         if iscc:
-            log(f"Inno Setup: found at {iscc}", "ok")
-            self.info.append(f"ISCC path: {iscc}")
-        else:
-            self.errors.append("Inno Setup 6 not found")
-            log("Inno Setup: NOT FOUND", "error")
-            print(f"\n{C.YELLOW}Install Inno Setup 6:{C.RESET}")
-            print("  https://jrsoftware.org/isdl.php")
-            print("  Or: winget install JRSoftware.InnoSetup")
+            return [], [], [f"ISCC path: {iscc}"], [format_log(f"Inno Setup: found at {iscc}", "ok")]
+
+        return ["Inno Setup 6 not found"], [], [], [
+            format_log("Inno Setup: NOT FOUND", "error"),
+            f"\n{C.YELLOW}Install Inno Setup 6:{C.RESET}",
+            "  https://jrsoftware.org/isdl.php",
+            "  Or: winget install JRSoftware.InnoSetup",
+        ]
 
-    def check_project_files(self) -> None:
+    def check_project_files(self) -> CheckResult:
         """Check required project files exist."""
         root = self.config.project_root
+        errors: List[str] = []
+        warnings: List[str] = []
+        lines: List[str] = []
 
-        # Check required files
-        for file in REQUIRED_FILES:
-            path = root / file
-            if path.exists():
-                log(f"{file}: found", "ok")
-            else:
-                self.errors.append(f"Required file not found: {file}")
-                log(f"{file}: NOT FOUND", "error")
-
-        # Check optional/configurable files
+        # Optional/configurable files
         optional_files = [
             ("spec_file", self.config.spec_file),
             ("installer_iss", self.config.installer_iss),
         ]
 
+        # One directory listing per parent instead of one stat per file
+        present = existing_files(root, REQUIRED_FILES + [file for _, file in optional_files])
+
+        # Check required files
+        for file in REQUIRED_FILES:
+            if file in present:
+                lines.append(format_log(f"{file}: found", "ok"))
+            else:
+                errors.append(f"Required file not found: {file}")
+                lines.append(format_log(f"{file}: NOT FOUND", "error"))
+
+        # Check optional/configurable files
         for name, file in optional_files:
-            path = root / file
-            if path.exists():
-                log(f"{file}: found", "ok")
+            if file in present:
+                lines.append(format_log(f"{file}: found", "ok"))
             else:
-                self.warnings.append(f"File not found: {file} (required for build)")
-                log(f"{file}: NOT FOUND (required for build)", "warn")
+                warnings.append(f"File not found: {file} (required for build)")
+                lines.append(format_log(f"{file}: NOT FOUND (required for build)", "warn"))
+        return errors, warnings, [], lines
 
-    def check_configuration(self) -> None:
+    def check_configuration(self) -> CheckResult:
         """Check release configuration."""
-        log(f"App name: {self.config.app_name}", "check")
-        log(f"Current version: {self.config.current_version}", "check")
-        log(f"Releases repo: {self.config.releases_repo or '(not set)'}", "check")
-        log(f"Build method: {self.config.build_method}", "check")
-        log(f"Installer name: {self.config.installer_name}", "check")
-        log(f"Spec file: {self.config.spec_file}", "check")
-        log(f"Init file: {self.config.init_file}", "check")
+        errors: List[str] = []
+        lines = [
+            format_log(f"App name: {self.config.app_name}", "check"),
+            format_log(f"Current version: {self.config.current_version}", "check"),
+            format_log(f"Releases repo: {self.config.releases_repo or '(not set)'}", "check"),
+            format_log(f"Build method: {self.config.build_method}", "check"),
+            format_log(f"Installer name: {self.config.installer_name}", "check"),
+            format_log(f"Spec file: {self.config.spec_file}", "check"),
+            format_log(f"Init file: {self.config.init_file}", "check"),
+        ]
 
         if not self.config.app_name:
-            self.errors.append("app_name not configured in pyproject.toml")
+            errors.append("app_name not configured in pyproject.toml")
         else:
-            log("app_name: OK", "ok")
+            lines.append(format_log("app_name: OK", "ok"))
 
         if not self.config.releases_repo:
-            self.errors.append(
+            errors.append(
                 "releases_repo not configured in pyproject.toml\n"
                 "Add to [tool.release] or [tool.spectra]:\n"
                 '  releases_repo = "username/appname-releases"'
             )
         else:
-            log("releases_repo: OK", "ok")
+            lines.append(format_log("releases_repo: OK", "ok"))
+        return errors, [], [], lines
 
-    def check_git_repo(self) -> None:
+    def check_git_repo(self) -> CheckResult:
         """Check Git repository status."""
         root = self.config.project_root
 
         # Check if git repo
-        success, _ = run("git rev-parse --git-dir", silent=True, ignore_error=True, cwd=root)
+        success, _ = run("git rev-parse --git-dir", silent=True, ignore_error=True, cwd=root, capture=False)
         if not success:
-            self.errors.append("Not a git repository. Run: git init")
-            log("Git repository: NOT FOUND", "error")
-            return
+            return ["Not a git repository. Run: git init"], [], [], [format_log("Git repository: NOT FOUND", "error")]
 
-        log("Git repository: OK", "ok")
+        lines = [format_log("Git repository: OK", "ok")]
 
         # Check remote
         success, output = run("git remote -v", silent=True, cwd=root)
         if success and "origin" in output:
-            log("Git remote 'origin': configured", "ok")
-        else:
-            self.warnings.append("Git remote 'origin' not configured")
-            log("Git remote 'origin': NOT CONFIGURED", "warn")
+            lines.append(format_log("Git remote 'origin': configured", "ok"))
+            return [], [], [], lines
+        lines.append(format_log("Git remote 'origin': NOT CONFIGURED", "warn"))
+        return [], ["Git remote 'origin' not configured"], [], lines
 
-    def check_releases_repo(self) -> None:
+    def check_releases_repo(self) -> CheckResult:
         """Check if releases repository exists on GitHub."""
         if not self.config.releases_repo:
-            log("Releases repo: skipped (not configured)", "warn")
-            return
+            return [], [], [], [format_log("Releases repo: skipped (not configured)", "warn")]
 
         success, _ = run(
             f"gh repo view {self.config.releases_repo} --json name",
@@ -634,13 +815,11 @@ class EnvironmentChecker:
         )
 
         if success:
-            log(f"Releases repo '{self.config.releases_repo}': exists", "ok")
-        else:
-            self.warnings.append(
-                f"Releases repo '{self.config.releases_repo}' does not exist.\n"
-                "It will be created automatically during first release."
-            )
-            log(f"Releases repo: NOT FOUND (will be created)", "warn")
+            return [], [], [], [format_log(f"Releases repo '{self.config.releases_repo}': exists", "ok")]
+        return [], [
+            f"Releases repo '{self.config.releases_repo}' does not exist.\n"
+            "It will be created automatically during first release."
+        ], [], [format_log("Releases repo: NOT FOUND (will be created)", "warn")]
 
     def _print_summary(self) -> None:
         """Print check summary."""
@@ -683,7 +862,8 @@ class EnvironmentChecker:
 class ReleaseManager:
     """Manages the release process."""
 
-    def __init__(self, config: Config, version: str, dry_run: bool = False, force: bool = False):
+    def __init__(self, config: Config, version: str, dry_run: bool = False, force: bool = False,
+                 parallel_build: bool = False):
         self.config = config
         self.version = version
         self.tag = f"v{version}"
@@ -691,6 +871,28 @@ class ReleaseManager:
         self.numeric_version = to_numeric_version(version)
         self.dry_run = dry_run
         self.force = force
+        self.parallel_build = parallel_build
+        self.iscc: Optional[str] = None  # Resolved by step1_validate
+
+        # Start time reserved for the next GitHub write request (see _gh_call)
+        self._gh_lock = threading.Lock()
+        self._gh_next_allowed = 0.0
+
+        # Project paths, resolved once
+        self.paths = SimpleNamespace(
+            pyproject=config.resolve_path(config.pyproject_toml),
+            installer_iss=config.resolve_path(config.installer_iss),
+            version_info=config.resolve_path(config.version_info),
+            init_py=config.resolve_path(config.init_file),
+            package_json=config.resolve_path(config.package_json) if config.package_json else None,
+            release_dir=config.resolve_path(config.release_dir),
+            latest_yml=config.resolve_path(config.latest_yml),
+            beta_yml=config.resolve_path(config.beta_yml),
+            dist_dir=config.resolve_path(config.dist_dir),
+            build_dir=config.resolve_path("build"),
+            spec_file=config.resolve_path(config.spec_file),
+            frontend_dir=config.resolve_path(config.frontend_dir),
+        )
         self.rollback_actions: List[Callable] = []
 
         # Original file contents for rollback
@@ -712,16 +914,12 @@ class ReleaseManager:
         log(f"Tag: {self.tag}", "info")
         log(f"Mode: {'DRY-RUN (simulation)' if self.dry_run else 'PRODUCTION'}", "info")
 
-        # Change to project root
-        os.chdir(self.cwd)
-
         try:
             self.step1_validate()
             self.step2_update_versions()
             self.step3_build()
             self.step4_generate_yml()
             self.step5_commit_tag()
-            self.step6_push()
             self.step7_release()
             self.step8_push_yml_to_releases()
             self.show_summary()
@@ -739,14 +937,41 @@ class ReleaseManager:
             raise ValueError(f"Invalid version format '{self.version}'. Expected: x.y.z or x.y.z-beta.n")
         log("Version format OK", "ok")
 
+        # The git/gh probes below are independent process spawns, so start
+        # them all at once and evaluate the results in order
+        gh_installed = _which("gh") is not None
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Exit status only: resolves one ref instead of listing every tag
+            tag_probe = executor.submit(
+                run,
+                f'git rev-parse --verify --quiet "refs/tags/{self.tag}"',
+                silent=True,
+                cwd=self.cwd,
+                capture=False,
+            )
+            status_probe = executor.submit(run, "git status --porcelain", silent=True, cwd=self.cwd)
+            gh_probe = executor.submit(self._gh_preflight) if gh_installed else None
+
+        # Check for gh CLI
+        if gh_probe is None:
+            raise ValueError("GitHub CLI (gh) is not installed. Run: --check for details")
+        log("GitHub CLI available - OK", "ok")
+
+        # Check gh auth (every GitHub API call below goes through gh, so all
+        # of them use this login); fail before any prompt or build
+        authenticated, repo_exists = gh_probe.result()
+        if not authenticated:
+            raise ValueError("GitHub CLI not authenticated. Run: gh auth login (or set GH_TOKEN)")
+        log("GitHub CLI authenticated - OK", "ok")
+
         # Check if tag already exists
-        success, stdout = run("git tag -l \"v*\"", silent=True, cwd=self.cwd)
-        if self.tag in stdout.split("\n"):
+        tag_exists, _ = tag_probe.result()
+        if tag_exists:
             raise ValueError(f"Tag {self.tag} already exists!")
         log(f"Tag {self.tag} does not exist - OK", "ok")
 
         # Check git status
-        success, stdout = run("git status --porcelain", silent=True, cwd=self.cwd)
+        success, stdout = status_probe.result()
         if stdout.strip():
             log("You have uncommitted changes:", "warn")
             print(stdout)
@@ -757,25 +982,8 @@ class ReleaseManager:
         else:
             log("Git status clean - OK", "ok")
 
-        # Check for gh CLI
-        success, _ = run("gh --version", silent=True, ignore_error=True)
-        if not success:
-            raise ValueError("GitHub CLI (gh) is not installed. Run: --check for details")
-        log("GitHub CLI available - OK", "ok")
-
-        # Check gh auth
-        success, _ = run("gh auth status", silent=True, ignore_error=True)
-        if not success:
-            raise ValueError("GitHub CLI not authenticated. Run: gh auth login")
-        log("GitHub CLI authenticated - OK", "ok")
-
         # Check if releases repo exists, create if not
-        success, _ = run(
-            f"gh repo view {self.config.releases_repo} --json name",
-            silent=True,
-            ignore_error=True
-        )
-        if not success:
+        if not repo_exists:
             log(f"Releases repo {self.config.releases_repo} does not exist", "warn")
             if not self.dry_run:
                 print(f"\n{C.YELLOW}Creating releases repo...{C.RESET}")
@@ -786,9 +994,14 @@ class ReleaseManager:
                 )
                 if success:
                     # Initialize with README
-                    with tempfile.TemporaryDirectory() as tmpdir:
+                    import tempfile
+                    with tempfile.TemporaryDirectory(prefix="release_repo_", ignore_cleanup_errors=True) as tmpdir:
                         repo_dir = Path(tmpdir) / "repo"
-                        run(f'git clone https://github.com/{self.config.releases_repo}.git "{repo_dir}"', silent=True)
+                        run(
+                            f'git -c protocol.version=2 clone --depth 1 --single-branch --filter=blob:none '
+                            f'https://github.com/{self.config.releases_repo}.git "{repo_dir}"',
+                            silent=True,
+                        )
                         readme = repo_dir / "README.md"
                         readme.write_text(
                             f"# {self.config.app_name} Releases\n\n"
@@ -807,7 +1020,7 @@ class ReleaseManager:
         # Check for build tools based on method
         if self.config.build_method == "electron":
             # Check npm
-            frontend_dir = self.config.resolve_path(self.config.frontend_dir)
+            frontend_dir = self.paths.frontend_dir
             if not (frontend_dir / "package.json").exists():
                 raise ValueError(f"package.json not found in {frontend_dir}")
             log(f"Build method: electron-builder", "ok")
@@ -818,13 +1031,14 @@ class ReleaseManager:
                 r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
                 r"C:\Program Files\Inno Setup 6\ISCC.exe",
             ]
-            if not any(find_executable("ISCC.exe", iscc_paths[1:])):
+            self.iscc = find_executable("ISCC.exe", iscc_paths[1:])
+            if not self.iscc:
                 log("Inno Setup (ISCC.exe) not found - build may fail", "warn")
             else:
                 log("Inno Setup available - OK", "ok")
 
         # Check for PyInstaller
-        success, _ = run("python -m PyInstaller --version", silent=True, ignore_error=True)
+        success, _ = run_argv(["python", "-m", "PyInstaller", "--version"], silent=True, ignore_error=True)
         if not success:
             raise ValueError("PyInstaller is not installed. Run: pip install pyinstaller")
         log("PyInstaller available - OK", "ok")
@@ -844,31 +1058,73 @@ class ReleaseManager:
             if ans != "y":
                 raise ValueError("Aborted")
 
+    def _gh_preflight(self) -> Tuple[bool, bool]:
+        """Return (authenticated, releases repo exists) from one GraphQL query.
+
+        Raises ValueError when gh fails for another reason (network, missing
+        releases_repo, unexpected output), with gh's own error message.
+        """
+        import json
+
+        owner, _, name = self.config.releases_repo.partition("/")
+        if not owner or not name:
+            raise ValueError(
+                f"releases_repo must be 'owner/name' in pyproject.toml, got '{self.config.releases_repo}'"
+            )
+
+        query = "query($owner: String!, $name: String!) { viewer { login } repository(owner: $owner, name: $name) { name } }"
+        argv = ["gh", "api", "graphql", "-f", f"query={query}", "-f", f"owner={owner}", "-f", f"name={name}"]
+        # A missing repo makes gh exit non-zero but still print the JSON
+        # response, so stdout and stderr are both needed (run_argv keeps one)
+        try:
+            result = subprocess.run(argv, capture_output=True, text=True, encoding="utf-8")
+        except OSError as e:
+            raise ValueError(f"Could not run GitHub CLI: {e}") from None
+        stderr = (result.stderr or "").strip()
+
+        try:
+            response = json.loads(result.stdout or "")
+        except ValueError:
+            response = None
+        if not isinstance(response, dict):
+            # No GraphQL response: gh refused before querying or the request failed
+            if "gh auth login" in stderr or "GH_TOKEN" in stderr:
+                return False, False
+            raise ValueError(f"GitHub CLI query failed: {stderr or f'exit code {result.returncode}'}")
+
+        data = response.get("data") or {}
+        if not data.get("viewer"):
+            if stderr:
+                log(f"gh: {stderr}", "warn")
+            return False, False
+        return True, bool(data.get("repository"))
+
     def step2_update_versions(self) -> None:
         """Step 2: Update version in all files."""
         subheader("Step 2: Update Versions")
 
-        # Backup original files
-        pyproject_path = self.config.resolve_path(self.config.pyproject_toml)
-        installer_path = self.config.resolve_path(self.config.installer_iss)
-        version_info_path = self.config.resolve_path(self.config.version_info)
-        init_py_path = self.config.resolve_path(self.config.init_file)
-
-        if pyproject_path.exists():
-            self.orig_pyproject = pyproject_path.read_text(encoding="utf-8")
-        if installer_path.exists():
-            self.orig_installer_iss = installer_path.read_text(encoding="utf-8")
-        if version_info_path.exists():
-            self.orig_version_info = version_info_path.read_text(encoding="utf-8")
-        if init_py_path.exists():
-            self.orig_init_py = init_py_path.read_text(encoding="utf-8")
+        # Backup original files (the backups are also the input for the edits below)
+        pyproject_path = self.paths.pyproject
+        installer_path = self.paths.installer_iss
+        version_info_path = self.paths.version_info
+        init_py_path = self.paths.init_py
+
+        def read_optional(path: Path) -> Optional[str]:
+            # Open directly instead of exists() + read (one syscall less per file)
+            try:
+                return path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return None
+
+        self.orig_pyproject = pyproject_path.read_text(encoding="utf-8")
+        self.orig_installer_iss = read_optional(installer_path)
+        self.orig_version_info = read_optional(version_info_path)
+        self.orig_init_py = read_optional(init_py_path)
 
         # Backup package.json if configured
-        package_json_path = None
-        if self.config.package_json:
-            package_json_path = self.config.resolve_path(self.config.package_json)
-            if package_json_path.exists():
-                self.orig_package_json = package_json_path.read_text(encoding="utf-8")
+        package_json_path = self.paths.package_json
+        if package_json_path:
+            self.orig_package_json = read_optional(package_json_path)
 
         # Add rollback action
         def rollback_files():
@@ -888,81 +1144,57 @@ class ReleaseManager:
 
         if not self.dry_run:
             # Update pyproject.toml
-            content = pyproject_path.read_text(encoding="utf-8")
-            content = re.sub(
-                r'^version = ".*"$',
-                f'version = "{self.version}"',
-                content,
-                flags=re.MULTILINE
-            )
+            content = _PYPROJECT_VER_RE.sub(f'version = "{self.version}"', self.orig_pyproject)
             pyproject_path.write_text(content, encoding="utf-8")
             log(f"pyproject.toml -> {self.version}", "ok")
 
             # Update installer.iss
-            if installer_path.exists():
-                content = installer_path.read_text(encoding="utf-8")
-                content = re.sub(
-                    r'#define MyAppVersion ".*"',
-                    f'#define MyAppVersion "{self.version}"',
-                    content
-                )
-                content = re.sub(
-                    r'#define MyAppNumericVersion ".*"',
-                    f'#define MyAppNumericVersion "{self.numeric_version}"',
-                    content
-                )
+            if self.orig_installer_iss is not None:
+                content = _ISS_VER_RE.sub(f'#define MyAppVersion "{self.version}"', self.orig_installer_iss)
+                content = _ISS_NUMVER_RE.sub(f'#define MyAppNumericVersion "{self.numeric_version}"', content)
                 installer_path.write_text(content, encoding="utf-8")
                 log(f"installer.iss -> {self.version}", "ok")
 
             # Update file_version_info.txt
-            if version_info_path.exists():
+            if self.orig_version_info is not None:
                 ver_tuple = to_file_version_tuple(self.version)
-                content = version_info_path.read_text(encoding="utf-8")
-                content = re.sub(
-                    r"filevers=\(\d+, \d+, \d+, \d+\)",
-                    f"filevers={ver_tuple}",
-                    content
-                )
-                content = re.sub(
-                    r"prodvers=\(\d+, \d+, \d+, \d+\)",
-                    f"prodvers={ver_tuple}",
-                    content
-                )
-                content = re.sub(
-                    r"StringStruct\(u'FileVersion', u'.*'\)",
-                    f"StringStruct(u'FileVersion', u'{self.version}')",
-                    content
-                )
-                content = re.sub(
-                    r"StringStruct\(u'ProductVersion', u'.*'\)",
-                    f"StringStruct(u'ProductVersion', u'{self.version}')",
-                    content
-                )
+                content = _FILEVERS_RE.sub(f"filevers={ver_tuple}", self.orig_version_info)
+                content = _PRODVERS_RE.sub(f"prodvers={ver_tuple}", content)
+                content = _FV_STRUCT_RE.sub(f"StringStruct(u'FileVersion', u'{self.version}')", content)
+                content = _PV_STRUCT_RE.sub(f"StringStruct(u'ProductVersion', u'{self.version}')", content)
                 version_info_path.write_text(content, encoding="utf-8")
                 log(f"file_version_info.txt -> {self.version}", "ok")
 
             # Update __init__.py (dynamically resolved)
-            if init_py_path.exists():
-                content = init_py_path.read_text(encoding="utf-8")
-                content = re.sub(
-                    r'__version__ = ".*"',
-                    f'__version__ = "{self.version}"',
-                    content
-                )
+            if self.orig_init_py is not None:
+                content = self.orig_init_py
+                # Replace the quoted value after the marker by slicing
+                marker = '__version__ = "'
+                start = content.find(marker)
+                end = content.find('"', start + len(marker)) if start != -1 else -1
+                if end != -1:
+                    content = content[:start + len(marker)] + self.version + content[end:]
                 init_py_path.write_text(content, encoding="utf-8")
                 log(f"{init_py_path.name} -> {self.version}", "ok")
             else:
                 log(f"{init_py_path.name} not found (skipped)", "warn")
 
             # Update package.json (if configured)
-            if package_json_path and package_json_path.exists():
+            if self.orig_package_json is not None:
                 import json
-                with open(package_json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data['version'] = self.version
-                with open(package_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    f.write('\n')
+
+                # Rewrite only the first "version" value; formatting stays as is.
+                # If that wasn't the top-level key, re-serialize instead
+                content = _PKG_VER_RE.sub(
+                    lambda m: m.group(1) + self.version + m.group(2),
+                    self.orig_package_json,
+                    count=1,
+                )
+                if json.loads(content).get("version") != self.version:
+                    data = json.loads(self.orig_package_json)
+                    data["version"] = self.version
+                    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+                package_json_path.write_text(content, encoding="utf-8")
                 log(f"package.json -> {self.version}", "ok")
 
         else:
@@ -984,7 +1216,9 @@ class ReleaseManager:
 
     def _build_electron(self) -> None:
         """Build with electron-builder (for Electron + Python hybrid apps)."""
-        frontend_dir = self.config.resolve_path(self.config.frontend_dir)
+        import shutil
+
+        frontend_dir = self.paths.frontend_dir
 
         # Clean previous builds
         log("Cleaning previous build...", "step")
@@ -992,15 +1226,14 @@ class ReleaseManager:
             dist_builder = frontend_dir / "dist-builder"
             if dist_builder.exists():
                 shutil.rmtree(dist_builder)
-            backend_dist = self.config.resolve_path(self.config.dist_dir)
+            backend_dist = self.paths.dist_dir
             if backend_dist.exists():
                 shutil.rmtree(backend_dist)
 
-        # Step 1: Build Python backend with PyInstaller (using venv Python)
-        log("Building Python backend (PyInstaller)...", "step")
-        spec_path = self.config.resolve_path(self.config.spec_file)
-        dist_path = self.config.resolve_path(self.config.dist_dir)
-        build_path = self.config.resolve_path("build")
+        # Build Python backend with PyInstaller (using venv Python)
+        spec_path = self.paths.spec_file
+        dist_path = self.paths.dist_dir
+        build_path = self.paths.build_dir
 
         # Use Python from backend venv to ensure all dependencies are available
         venv_python = self.config.resolve_path("backend/venv/Scripts/python.exe")
@@ -1010,27 +1243,43 @@ class ReleaseManager:
         if not venv_python.exists() and not self.dry_run:
             raise ValueError(f"Backend venv Python not found at {venv_python}. Run: cd backend && python -m venv venv && pip install -r requirements.txt")
 
-        success, _ = run(
-            f'"{venv_python}" -m PyInstaller --distpath "{dist_path}" --workpath "{build_path}" "{spec_path}"',
-            dry_run=self.dry_run, cwd=self.cwd
-        )
-        if not success and not self.dry_run:
-            raise ValueError("PyInstaller build failed")
+        def build_backend() -> None:
+            success, _ = run(
+                f'"{venv_python}" -m PyInstaller --distpath "{dist_path}" --workpath "{build_path}" "{spec_path}"',
+                dry_run=self.dry_run, cwd=self.cwd
+            )
+            if not success and not self.dry_run:
+                raise ValueError("PyInstaller build failed")
 
-        # Step 2: Build Electron app with electron-builder
-        log("Building Electron app (electron-builder)...", "step")
-        success, output = run(
-            "npm run electron:build",
-            dry_run=self.dry_run, cwd=frontend_dir
-        )
-        if not success and not self.dry_run:
-            raise ValueError(f"electron-builder failed: {output}")
+        # Build Electron app with electron-builder
+        def build_frontend() -> None:
+            success, output = run(
+                "npm run electron:build",
+                dry_run=self.dry_run, cwd=frontend_dir
+            )
+            if not success and not self.dry_run:
+                raise ValueError(f"electron-builder failed: {output}")
+
+        # electron-builder usually packages the backend (extraResources), so it
+        # must run after PyInstaller. --parallel-build overlaps the two for
+        # layouts where they only meet in the Inno Setup step.
+        if self.parallel_build:
+            log("Building Python backend (PyInstaller) and Electron app (electron-builder)...", "step")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                builds = [executor.submit(build_backend), executor.submit(build_frontend)]
+            for build in builds:
+                build.result()
+        else:
+            log("Building Python backend (PyInstaller)...", "step")
+            build_backend()
+            log("Building Electron app (electron-builder)...", "step")
+            build_frontend()
 
-        # Step 3: Build installer with Inno Setup (if configured)
+        # Build installer with Inno Setup (if configured)
         # electron-builder with target: "dir" creates only win-unpacked folder
         # Inno Setup creates the actual installer from win-unpacked
         installer_name = self.config.installer_name.replace("{version}", self.version)
-        iss_path = self.config.resolve_path(self.config.installer_iss)
+        iss_path = self.paths.installer_iss
 
         if iss_path.exists():
             log("Building installer (Inno Setup)...", "step")
@@ -1039,7 +1288,7 @@ class ReleaseManager:
                 raise ValueError(f"Inno Setup failed: {output}")
 
             # Verify installer was created
-            release_dir = self.config.resolve_path(self.config.release_dir)
+            release_dir = self.paths.release_dir
             final_installer = release_dir / installer_name
             if not self.dry_run and not final_installer.exists():
                 raise ValueError(f"Installer not found: {final_installer}")
@@ -1065,31 +1314,38 @@ class ReleaseManager:
                     files = list(dist_builder.glob("*.exe")) if dist_builder.exists() else []
                     raise ValueError(f"Installer not found in {dist_builder}. Found: {[f.name for f in files]}")
 
-                release_dir = self.config.resolve_path(self.config.release_dir)
+                release_dir = self.paths.release_dir
                 release_dir.mkdir(parents=True, exist_ok=True)
                 final_installer = release_dir / installer_name
-                shutil.copy2(found_installer, final_installer)
+                # On the same volume a rename moves the installer without copying
+                # it; dist-builder is wiped before the next build anyway
+                if found_installer.stat().st_dev == release_dir.stat().st_dev:
+                    os.replace(found_installer, final_installer)
+                else:
+                    shutil.copyfile(found_installer, final_installer)
                 log(f"Installer: {installer_name}", "ok")
             else:
                 log(f"Would create installer: {installer_name}", "dry")
 
     def _build_innosetup(self) -> None:
         """Build with PyInstaller + Inno Setup (standalone Python apps)."""
+        import shutil
+
         # Clean previous build
         log("Cleaning previous build...", "step")
         if not self.dry_run:
-            dist_path = self.config.resolve_path(self.config.dist_dir)
+            dist_path = self.paths.dist_dir
             if dist_path.exists():
                 shutil.rmtree(dist_path)
-            build_path = self.config.resolve_path("build")
+            build_path = self.paths.build_dir
             if build_path.exists():
                 shutil.rmtree(build_path)
 
         # Build with PyInstaller
         log("Building with PyInstaller...", "step")
-        spec_path = self.config.resolve_path(self.config.spec_file)
-        dist_path = self.config.resolve_path(self.config.dist_dir)
-        build_path = self.config.resolve_path("build")
+        spec_path = self.paths.spec_file
+        dist_path = self.paths.dist_dir
+        build_path = self.paths.build_dir
         success, _ = run(
             f'python -m PyInstaller --distpath "{dist_path}" --workpath "{build_path}" "{spec_path}"',
             dry_run=self.dry_run, cwd=self.cwd
@@ -1099,29 +1355,18 @@ class ReleaseManager:
 
         # Build installer with Inno Setup
         log("Building installer (Inno Setup)...", "step")
-        iss_path = self.config.resolve_path(self.config.installer_iss)
-
-        # Try ISCC.exe in PATH first, then default locations
-        iscc_paths = [
-            "ISCC.exe",
-            r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
-            r"C:\Program Files\Inno Setup 6\ISCC.exe",
-        ]
+        iss_path = self.paths.installer_iss
 
-        success = False
-        for iscc in iscc_paths:
-            if not Path(iscc).exists() and iscc != "ISCC.exe":
-                continue
-            success, _ = run(f'"{iscc}" "{iss_path}"', dry_run=self.dry_run, ignore_error=True, cwd=self.cwd)
-            if success or self.dry_run:
-                break
+        # ISCC located by step1_validate (PATH first, then default locations)
+        iscc = self.iscc or "ISCC.exe"
+        success, _ = run(f'"{iscc}" "{iss_path}"', dry_run=self.dry_run, ignore_error=True, cwd=self.cwd)
 
         if not success and not self.dry_run:
             raise ValueError("Inno Setup build failed. Make sure Inno Setup 6 is installed.")
 
         # Verify installer was created
         installer_name = self.config.installer_name.replace("{version}", self.version)
-        installer_path = self.config.resolve_path(self.config.release_dir) / installer_name
+        installer_path = self.paths.release_dir / installer_name
 
         if not self.dry_run and not installer_path.exists():
             raise ValueError(f"Installer not found: {installer_path}")
@@ -1133,7 +1378,7 @@ class ReleaseManager:
         subheader("Step 4: Generate YML")
 
         installer_name = self.config.installer_name.replace("{version}", self.version)
-        installer_path = self.config.resolve_path(self.config.release_dir) / installer_name
+        installer_path = self.paths.release_dir / installer_name
 
         if self.dry_run:
             if self.beta:
@@ -1143,14 +1388,17 @@ class ReleaseManager:
                 log(f"Would generate latest.yml and beta.yml for {installer_name}", "dry")
             return
 
-        # Calculate hash and size
-        hash_value = sha512_file(installer_path)
-        size = file_size(installer_path)
+        # Calculate hash and size in one pass over the installer
+        try:
+            hash_value, size = sha512_and_size(installer_path)
+        except FileNotFoundError:
+            raise ValueError(f"Installer not found: {installer_path}") from None
 
         log(f"SHA512: {hash_value[:40]}...", "info")
         log(f"Size: {size / 1024 / 1024:.2f} MB", "info")
 
         # Generate YML content
+        from datetime import datetime, timezone
         yml_content = f"""version: {self.version}
 files:
   - url: {installer_name}
@@ -1162,12 +1410,12 @@ releaseDate: '{datetime.now(timezone.utc).isoformat()}'
 """
 
         # Create release directory if needed
-        release_dir = self.config.resolve_path(self.config.release_dir)
+        release_dir = self.paths.release_dir
         release_dir.mkdir(parents=True, exist_ok=True)
 
         # Write YML files
-        latest_yml = self.config.resolve_path(self.config.latest_yml)
-        beta_yml = self.config.resolve_path(self.config.beta_yml)
+        latest_yml = self.paths.latest_yml
+        beta_yml = self.paths.beta_yml
 
         if self.beta:
             beta_yml.write_text(yml_content, encoding="utf-8")
@@ -1179,8 +1427,8 @@ releaseDate: '{datetime.now(timezone.utc).isoformat()}'
             log("Created beta.yml", "ok")
 
     def step5_commit_tag(self) -> None:
-        """Step 5: Commit and tag."""
-        subheader("Step 5: Commit and Tag")
+        """Step 5: Commit, tag and push."""
+        subheader("Step 5: Commit, Tag and Push")
 
         # Determine which YML files to commit
         if self.beta:
@@ -1191,180 +1439,230 @@ releaseDate: '{datetime.now(timezone.utc).isoformat()}'
                      self.config.version_info, self.config.latest_yml, self.config.beta_yml]
 
         # Add init file if it exists and was modified
-        if self.config.resolve_path(self.config.init_file).exists():
+        if self.paths.init_py.exists():
             files.append(self.config.init_file)
 
         # Add package.json if configured
-        if self.config.package_json and self.config.resolve_path(self.config.package_json).exists():
+        if self.paths.package_json and self.paths.package_json.exists():
             files.append(self.config.package_json)
 
-        # Add files
-        for file in files:
-            file_path = self.config.resolve_path(file)
-            if file_path.exists():
-                run(f'git add "{file}"', silent=True, dry_run=self.dry_run, cwd=self.cwd)
+        existing = [file for file in files if self.config.resolve_path(file).exists()]
+        self._commit_tag_and_push(existing)
 
-        # Commit
+    def _commit_tag_and_push(self, files: List[str]) -> None:
+        """Add and commit, then tag and push, in as few git invocations as possible."""
         commit_msg = f"release: v{self.version}"
-        success, _ = run(f'git commit -m "{commit_msg}"', dry_run=self.dry_run, cwd=self.cwd)
+        tag_msg = f"Release {self.version}{' (BETA)' if self.beta else ''}"
+
+        # One git invocation, one index lock
+        add_cmd = "git add -- " + " ".join(f'"{file}"' for file in files) if files else None
+        commit_cmd = f'git commit -m "{commit_msg}"'
+        tag_cmds = [f'git tag -a "{self.tag}" -m "{tag_msg}"', "git push origin"]
+        push_tag_cmd = f'git push origin "{self.tag}"'
+
+        if self.dry_run:
+            for cmd in [add_cmd, commit_cmd] + tag_cmds + [push_tag_cmd]:
+                if cmd:
+                    log(f"Would run: {cmd}", "dry")
+            return
+
+        if add_cmd:
+            success, output = run(add_cmd, cwd=self.cwd)
+            if not success:
+                raise ValueError(f"git add failed: {output}")
+
+        # Nothing staged is not fatal (e.g. re-releasing the current version);
+        # the tag then points at the current HEAD
+        nothing_staged, _ = run("git diff --cached --quiet", silent=True, ignore_error=True,
+                                cwd=self.cwd, capture=False)
+        branch_pushed = False
+
+        if not nothing_staged:
+            success, output = run(commit_cmd, cwd=self.cwd)
+            if not success:
+                raise ValueError(f"git commit failed: {output}")
 
-        if not self.dry_run and success:
             def rollback_commit():
+                # A pushed commit stays; rewriting it would diverge from origin
+                if branch_pushed:
+                    log("Commit already pushed, not rolling it back", "warn")
+                    return
                 log("Rolling back commit...", "warn")
                 run("git reset --soft HEAD~1", silent=True, cwd=self.cwd)
             self.rollback_actions.append(rollback_commit)
+        else:
+            log("Nothing committed, tagging current HEAD", "warn")
 
-        # Tag
-        tag_msg = f"Release {self.version}{' (BETA)' if self.beta else ''}"
-        success, _ = run(f'git tag -a "{self.tag}" -m "{tag_msg}"', dry_run=self.dry_run, cwd=self.cwd)
-
-        if not self.dry_run and success:
-            def rollback_tag():
-                log(f"Removing tag {self.tag}...", "warn")
-                run(f'git tag -d "{self.tag}"', silent=True, cwd=self.cwd)
-            self.rollback_actions.append(rollback_tag)
+        def rollback_tag():
+            log(f"Removing tag {self.tag}...", "warn")
+            run(f'git tag -d "{self.tag}"', silent=True, ignore_error=True, cwd=self.cwd)
+        self.rollback_actions.append(rollback_tag)
 
+        # The branch push is the last command of the chain, so a failure means
+        # it did not happen
+        success, _ = run(" && ".join(tag_cmds), cwd=self.cwd)
+        if not success:
+            raise ValueError("Tag or push branch failed")
+        branch_pushed = True
         log("Commit and tag created", "ok")
 
-    def step6_push(self) -> None:
-        """Step 6: Push to origin."""
-        subheader("Step 6: Push")
+        success, _ = run(push_tag_cmd, cwd=self.cwd)
+        if not success:
+            raise ValueError("Push tag failed")
+        log("Push completed", "ok")
 
-        success, _ = run("git push origin", dry_run=self.dry_run, cwd=self.cwd)
-        if not success and not self.dry_run:
-            raise ValueError("Push branch failed")
+    def _gh_call(self, fn: Callable[..., Tuple[bool, str]], *args, **kwargs) -> Tuple[bool, str]:
+        """Run a GitHub write through fn (run/run_argv), spaced out and retried on rate limits."""
+        import time
 
-        success, _ = run(f'git push origin "{self.tag}"', dry_run=self.dry_run, cwd=self.cwd)
-        if not success and not self.dry_run:
-            raise ValueError("Push tag failed")
+        delay = GH_RETRY_DELAY
+        for attempt in range(GH_MAX_RETRIES + 1):
+            # Reserve a start slot; concurrent callers start GH_MUTATION_GAP apart
+            with self._gh_lock:
+                now = time.monotonic()
+                start = max(now, self._gh_next_allowed)
+                self._gh_next_allowed = start + GH_MUTATION_GAP
+            time.sleep(start - now)
 
-        log("Push completed", "ok")
+            success, output = fn(*args, **kwargs)
+            if success or attempt == GH_MAX_RETRIES or not _GH_RATE_LIMIT_RE.search(output):
+                return success, output
+
+            log(f"GitHub rate limit hit, retrying in {delay:.0f}s...", "warn")
+            time.sleep(delay)
+            delay *= 2
+        return success, output
 
     def step7_release(self) -> None:
         """Step 7: Create GitHub release."""
         subheader("Step 7: GitHub Release")
 
         installer_name = self.config.installer_name.replace("{version}", self.version)
-        installer_path = self.config.resolve_path(self.config.release_dir) / installer_name
+        installer_path = self.paths.release_dir / installer_name
         title = f"{self.config.app_name} v{self.version}{' [BETA]' if self.beta else ''}"
 
-        body = f"""## {self.config.app_name} v{self.version}{' [BETA]' if self.beta else ''}
-
-{"> **Note:** This is a beta version. It may contain bugs." + chr(10) if self.beta else ""}
-### Installation
-1. Download `{installer_name}`
-2. Run the installer
-3. On first run, Windows SmartScreen may appear - click "More info" > "Run anyway"
-
-### Requirements
-- Windows 10/11 (64-bit)
-"""
+        lines = [f"## {title}", ""]
+        if self.beta:
+            lines += ["> **Note:** This is a beta version. It may contain bugs.", ""]
+        lines += [
+            "### Installation",
+            f"1. Download `{installer_name}`",
+            "2. Run the installer",
+            '3. On first run, Windows SmartScreen may appear - click "More info" > "Run anyway"',
+            "",
+            "### Requirements",
+            "- Windows 10/11 (64-bit)",
+            "",
+        ]
+        body = "\n".join(lines)
 
         if self.dry_run:
             log(f"Would create release: {title}", "dry")
             return
 
-        # Write body to temp file
-        release_dir = self.config.resolve_path(self.config.release_dir)
-        temp_body = release_dir / "release-body-temp.md"
-        temp_body.write_text(body, encoding="utf-8")
-
         # Determine which files to upload
-        latest_yml = self.config.resolve_path(self.config.latest_yml)
-        beta_yml = self.config.resolve_path(self.config.beta_yml)
+        latest_yml = self.paths.latest_yml
+        beta_yml = self.paths.beta_yml
         yml_files = [str(beta_yml)] if self.beta else [str(latest_yml), str(beta_yml)]
         files = [str(installer_path)] + [f for f in yml_files if Path(f).exists()]
-        files_str = " ".join(f'"{f}"' for f in files)
 
+        # Create the release as a draft without assets; gh uploads the assets of
+        # a single command one after another, so they are uploaded separately
+        # below and the release is published once all of them are in place
+        # (auto-updaters never see a release without installer/yml)
+        repo = self.config.releases_repo
         cmd = (
             f'gh release create "{self.tag}" '
-            f'--repo {self.config.releases_repo} '
+            f'--repo {repo} '
             f'--title "{title}" '
-            f'--notes-file "{temp_body}" '
-            f'{"--prerelease " if self.beta else ""}'
-            f'{files_str}'
+            f'--notes-file - '
+            f'--draft'
+            f'{" --prerelease" if self.beta else ""}'
         )
 
         log(f"Creating release in {self.config.releases_repo}...", "step")
-        success, _ = run(cmd, cwd=self.cwd)
-
-        # Clean up temp file
-        if temp_body.exists():
-            temp_body.unlink()
-
+        # Release notes go to gh on stdin
+        success, _ = self._gh_call(run, cmd, cwd=self.cwd, input=body)
         if not success:
             raise ValueError("GitHub Release creation failed")
 
+        # Upload assets concurrently (the small yml uploads overlap the installer's)
+        log("Uploading release assets...", "step")
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            uploads = {
+                file: executor.submit(
+                    self._gh_call,
+                    run,
+                    f'gh release upload "{self.tag}" --repo {repo} "{file}"',
+                    silent=True,
+                    cwd=self.cwd,
+                )
+                for file in files
+            }
+        failed = [Path(file).name for file, upload in uploads.items() if not upload.result()[0]]
+        if failed:
+            # Don't leave a half-uploaded draft behind
+            self._gh_call(run, f'gh release delete "{self.tag}" --repo {repo} --yes', silent=True,
+                          ignore_error=True, cwd=self.cwd)
+            raise ValueError(f"Uploading release assets failed: {', '.join(failed)}")
+
+        # Publish the draft now that all assets are uploaded
+        success, _ = self._gh_call(run, f'gh release edit "{self.tag}" --repo {repo} --draft=false', cwd=self.cwd)
+        if not success:
+            raise ValueError(f"Publishing GitHub Release failed (draft {self.tag} left in {repo})")
+
         log("GitHub Release created!", "ok")
 
     def step8_push_yml_to_releases(self) -> None:
         """Step 8: Push yml files to releases repo main branch."""
         subheader("Step 8: Push YML to releases repo")
 
+        yml_files = []
+        if not self.beta:
+            yml_files.append(self.paths.latest_yml)
+        yml_files.append(self.paths.beta_yml)
+
         if self.dry_run:
-            log("Would clone releases repo and push yml files", "dry")
+            log("Would upload yml files to releases repo via the GitHub API", "dry")
             return
 
-        original_cwd = os.getcwd()
-        temp_dir = Path(tempfile.mkdtemp(prefix="release_yml_"))
-        repo_dir = temp_dir / "releases"
-
-        try:
-            # Clone releases repo
-            log("Cloning releases repo...", "step")
-            success, _ = run(
-                f'git clone --depth 1 https://github.com/{self.config.releases_repo}.git "{repo_dir}"',
-                silent=True
-            )
-            if not success:
-                raise ValueError("Failed to clone releases repo")
+        import base64
+        import hashlib
 
-            # Copy yml files
-            yml_files = []
-            if not self.beta:
-                yml_files.append(self.config.resolve_path(self.config.latest_yml))
-            yml_files.append(self.config.resolve_path(self.config.beta_yml))
+        # Upload through the Contents API (one request per file) instead of
+        # cloning the releases repo
+        commit_msg = f"update: yml files for v{self.version}"
+        for yml_file in yml_files:
+            if not yml_file.exists():
+                continue
 
-            for yml_file in yml_files:
-                if yml_file.exists():
-                    dst = repo_dir / yml_file.name
-                    shutil.copy2(yml_file, dst)
-                    log(f"Copied {yml_file.name}", "ok")
+            data = yml_file.read_bytes()
+            endpoint = f"repos/{self.config.releases_repo}/contents/{yml_file.name}"
 
-            # Commit and push
-            os.chdir(repo_dir)
+            # Current blob SHA (needed to update an existing file)
+            success, output = run_argv(["gh", "api", f"{endpoint}?ref=main", "--jq", ".sha"], silent=True)
+            existing_sha = output.strip() if success else ""
 
-            run("git add *.yml", silent=True)
+            # Git blob id of the new content; equal ids mean nothing changed
+            blob_sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+            if existing_sha == blob_sha:
+                log(f"{yml_file.name}: no changes", "info")
+                continue
 
-            commit_msg = f"update: yml files for v{self.version}"
-            success, _ = run(f'git commit -m "{commit_msg}"', silent=True)
+            argv = [
+                "gh", "api", "--method", "PUT", endpoint,
+                "-f", f"message={commit_msg}",
+                "-f", f"content={base64.b64encode(data).decode('ascii')}",
+                "-f", "branch=main",
+            ]
+            if existing_sha:
+                argv += ["-f", f"sha={existing_sha}"]
 
+            success, _ = self._gh_call(run_argv, argv, silent=True)
             if success:
-                log("Pushing to releases repo...", "step")
-                success, _ = run("git push origin main", silent=True)
-                if not success:
-                    log("Failed to push yml to releases repo (non-fatal)", "warn")
-                else:
-                    log("YML files pushed to releases repo", "ok")
+                log(f"{yml_file.name} pushed to releases repo", "ok")
             else:
-                log("No yml changes to commit", "info")
-
-        except Exception as e:
-            log(f"Failed to push yml to releases repo: {e} (non-fatal)", "warn")
-        finally:
-            # Return to original directory
-            os.chdir(original_cwd)
-
-            # Clean up temp directory (ignore errors on Windows)
-            try:
-                def remove_readonly(func, path, _):
-                    """Clear readonly bit and retry remove."""
-                    os.chmod(path, 0o777)
-                    func(path)
-
-                shutil.rmtree(temp_dir, onerror=remove_readonly)
-            except Exception:
-                pass  # Ignore cleanup errors
+                log(f"Failed to push {yml_file.name} to releases repo (non-fatal)", "warn")
 
     def show_summary(self) -> None:
         """Show release summary."""
@@ -1467,6 +1765,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run preflight checks before release"
     )
+    parser.add_argument(
+        "--parallel-build",
+        action="store_true",
+        help="Build backend and Electron frontend at the same time (only if electron-builder does not package the backend)"
+    )
 
     return parser.parse_args()
 
@@ -1476,7 +1779,8 @@ def main() -> None:
     args = parse_args()
 
     try:
-        config = Config.load()
+        # Dry runs leave no files behind, including the parsed-config cache
+        config = Config.load(write_cache=not args.dry_run)
     except Exception as e:
         log(f"Configuration error: {e}", "error")
         sys.exit(1)
@@ -1514,6 +1818,7 @@ def main() -> None:
         version=version,
         dry_run=args.dry_run,
         force=args.force,
+        parallel_build=args.parallel_build,
     )
 
     manager.execute()
@@ -41,12 +41,21 @@ from __future__ import annotations
 
 import argparse
 import json
-import platform
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ============================================================================
 # CONSTANTS
@@ -56,6 +65,19 @@ SCRIPT_VERSION = "1.1"
 MIN_PYTHON_VERSION = (3, 10)
 SUPPORTED_FRAMEWORKS = ["pyqt6", "customtkinter", "cli"]
 
+# Directories never scanned for UI sources (caches, virtualenvs, VCS data).
+# build/dist are not skipped: they can be real packages, and --stats counts them.
+SKIP_DIRS = frozenset({
+    "__pycache__", ".venv", "venv", "site-packages", "node_modules", ".git",
+})
+
+# Translation files are parsed from bytes; orjson (optional) parses in C.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# i18n import line in UI sources (e.g. "from app.utils.i18n import t")
+_I18N_IMPORT_RE = re.compile(rb"from\s+\S*i18n\S*\s+import\s+\(?\s*(?:t\b|get_i18n)")
+
 
 # ============================================================================
 # COLORS
@@ -77,15 +99,17 @@ class Colors:
     @classmethod
     def init(cls) -> None:
         """Initialize colors (enable ANSI on Windows if possible)."""
-        if platform.system() == "Windows":
+        if sys.platform == "win32":
             try:
                 import ctypes
                 kernel32 = ctypes.windll.kernel32
                 kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
             except Exception:
-                for attr in dir(cls):
-                    if not attr.startswith("_") and attr.isupper():
-                        setattr(cls, attr, "")
+                for attr in _COLOR_ATTRS:
+                    setattr(cls, attr, "")
+
+
+_COLOR_ATTRS = ("RESET", "BOLD", "DIM", "RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "WHITE")
 
 
 Colors.init()
@@ -96,28 +120,40 @@ C = Colors()
 # LOGGING
 # ============================================================================
 
+_LOG_PREFIXES = {
+    "info": f"{C.CYAN}[INFO]{C.RESET}",
+    "ok": f"{C.GREEN}[OK]{C.RESET}",
+    "warn": f"{C.YELLOW}[WARN]{C.RESET}",
+    "error": f"{C.RED}[ERROR]{C.RESET}",
+    "step": f"{C.MAGENTA}[STEP]{C.RESET}",
+    "dry": f"{C.BLUE}[DRY]{C.RESET}",
+    "check": f"{C.WHITE}[CHECK]{C.RESET}",
+    "i18n": f"{C.YELLOW}[i18n]{C.RESET}",
+}
+
+_HEADER_LINE = f"{C.BOLD}{C.CYAN}{'=' * 60}{C.RESET}"
+
+
+def _format_log(msg: str, level: str = "info") -> str:
+    """Return the line log() would print."""
+    return f"{_LOG_PREFIXES.get(level, _LOG_PREFIXES['info'])} {msg}"
+
+
 def log(msg: str, level: str = "info") -> None:
     """Print a colored log message."""
-    prefixes = {
-        "info": f"{C.CYAN}[INFO]{C.RESET}",
-        "ok": f"{C.GREEN}[OK]{C.RESET}",
-        "warn": f"{C.YELLOW}[WARN]{C.RESET}",
-        "error": f"{C.RED}[ERROR]{C.RESET}",
-        "step": f"{C.MAGENTA}[STEP]{C.RESET}",
-        "dry": f"{C.BLUE}[DRY]{C.RESET}",
-        "check": f"{C.WHITE}[CHECK]{C.RESET}",
-        "i18n": f"{C.YELLOW}[i18n]{C.RESET}",
-    }
-    prefix = prefixes.get(level, prefixes["info"])
-    print(f"{prefix} {msg}")
+    print(_format_log(msg, level))
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered output lines with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def header(title: str) -> None:
     """Print a section header."""
-    line = "=" * 60
-    print(f"\n{C.BOLD}{C.CYAN}{line}{C.RESET}")
+    print(f"\n{_HEADER_LINE}")
     print(f"{C.BOLD}  {title}{C.RESET}")
-    print(f"{C.BOLD}{C.CYAN}{line}{C.RESET}\n")
+    print(f"{_HEADER_LINE}\n")
 
 
 def subheader(title: str) -> None:
@@ -223,6 +259,51 @@ class I18nConfig:
 # ENVIRONMENT CHECKER
 # ============================================================================
 
+def _iter_py_files(root: Path, skip: frozenset = SKIP_DIRS) -> List[Path]:
+    """Collect *.py files under root, pruning SKIP_DIRS before descending."""
+    py_files: List[Path] = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # DirEntry carries the file type, so no extra stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            pending.append(Path(entry.path))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        py_files.append(Path(entry.path))
+        except OSError:
+            continue
+    return py_files
+
+
+def _scan_file(py_file: Path) -> Tuple[Path, bool]:
+    """Return (file, uses i18n) for one UI source file."""
+    import mmap
+
+    try:
+        with open(py_file, "rb") as f:
+            # Search the mapped bytes in place; nothing is copied or decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Cheap gate first: most files never mention i18n
+                if mm.find(b"i18n") == -1:
+                    return py_file, False
+                has_i18n = _I18N_IMPORT_RE.search(mm) is not None
+    except (OSError, ValueError):
+        # Unreadable, or empty (an empty file cannot be mapped)
+        return py_file, False
+    return py_file, has_i18n
+
+
+@cache
+def _load_translation(path_str: str) -> Dict:
+    """Parse a translation file once per run (callers must not mutate it)."""
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
+
 class EnvironmentChecker:
     """Check environment before initializing i18n."""
 
@@ -231,6 +312,7 @@ class EnvironmentChecker:
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        self._flat_keys: Dict[str, FrozenSet[str]] = {}  # Flattened keys per translation file
 
     def check_all(self) -> bool:
         """Run all checks."""
@@ -327,65 +409,62 @@ class EnvironmentChecker:
             log("Directory NOT FOUND (will be created with --init)", "warn")
             return
 
-        for lang in self.config.supported_languages:
-            filepath = trans_dir / f"{lang}.json"
-            if filepath.exists():
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    # Flatten and count keys
-                    keys = self._flatten_dict(data)
-                    log(f"{lang}.json: {len(keys)} keys", "ok")
-                except Exception as e:
-                    self.warnings.append(f"Cannot read {lang}.json: {e}")
-                    log(f"{lang}.json: INVALID ({e})", "warn")
+        # Load and flatten the files in parallel, report in language order
+        langs = self.config.supported_languages
+        filepaths = [trans_dir / f"{lang}.json" for lang in langs]
+        if len(filepaths) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as executor:
+                results = list(executor.map(self._safe_load, filepaths))
+        else:
+            results = [self._safe_load(filepath) for filepath in filepaths]
+
+        # One line per language; emitted together once all files are checked
+        lines: List[str] = []
+        for lang, (keys, error) in zip(langs, results, strict=True):
+            if keys is not None:
+                lines.append(_format_log(f"{lang}.json: {len(keys)} keys", "ok"))
+            elif error is not None:
+                self.warnings.append(f"Cannot read {lang}.json: {error}")
+                lines.append(_format_log(f"{lang}.json: INVALID ({error})", "warn"))
             else:
                 self.warnings.append(f"Missing translation file: {lang}.json")
-                log(f"{lang}.json: NOT FOUND", "warn")
+                lines.append(_format_log(f"{lang}.json: NOT FOUND", "warn"))
+        if lines:
+            _write_lines(lines)
 
     def check_ui_coverage(self) -> None:
         """Check how many UI files use i18n."""
-        total_files = 0
-        files_with_i18n = 0
-        files_details = []
+        all_files: List[Path] = []
+        lines: List[str] = []
 
         for source_dir in self.config.source_dirs:
             source_path = self.config.resolve_path(source_dir)
-            log(f"Source: {source_path}", "check")
+            lines.append(_format_log(f"Source: {source_path}", "check"))
 
             if not source_path.exists():
                 self.warnings.append(f"Source directory not found: {source_path}")
-                log(f"NOT FOUND: {source_path}", "warn")
+                lines.append(_format_log(f"NOT FOUND: {source_path}", "warn"))
                 continue
 
             # Scan Python files
-            py_files = list(source_path.rglob("*.py"))
-            total_files += len(py_files)
-            log(f"Files scanned: {len(py_files)}", "check")
-
-            for py_file in py_files:
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    # Check for i18n imports
-                    has_i18n = (
-                        "from" in content and "i18n" in content and "import" in content and
-                        ("import t" in content or "import get_i18n" in content)
-                    )
-
-                    if has_i18n:
-                        files_with_i18n += 1
-                        files_details.append((py_file, True))
-                    else:
-                        files_details.append((py_file, False))
-
-                except Exception:
-                    pass
+            py_files = _iter_py_files(source_path)
+            all_files.extend(py_files)
+            lines.append(_format_log(f"Files scanned: {len(py_files)}", "check"))
+
+        # Reads are I/O-bound and independent; overlap them on a thread pool
+        total_files = len(all_files)
+        if total_files > 1:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                files_details = list(executor.map(_scan_file, all_files))
+        else:
+            files_details = [_scan_file(py_file) for py_file in all_files]
+        files_with_i18n = sum(1 for _, has_i18n in files_details if has_i18n)
 
         if total_files > 0:
             coverage = (files_with_i18n / total_files) * 100
-            log(f"Coverage: {coverage:.0f}% ({files_with_i18n}/{total_files})", "info")
+            lines.append(_format_log(f"Coverage: {coverage:.0f}% ({files_with_i18n}/{total_files})", "info"))
+        if lines:
+            _write_lines(lines)
 
     def check_key_consistency(self) -> None:
         """Check key consistency between languages."""
@@ -395,17 +474,12 @@ class EnvironmentChecker:
             log("Skipping (no translations directory)", "info")
             return
 
-        # Load all translations
-        translations: Dict[str, Set[str]] = {}
+        # Load all translations (already parsed by check_translation_files)
+        translations: Dict[str, FrozenSet[str]] = {}
         for lang in self.config.supported_languages:
-            filepath = trans_dir / f"{lang}.json"
-            if filepath.exists():
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    translations[lang] = self._flatten_dict(data)
-                except Exception:
-                    pass
+            keys, _ = self._safe_load(trans_dir / f"{lang}.json")
+            if keys is not None:
+                translations[lang] = keys
 
         if not translations:
             log("No valid translation files to compare", "info")
@@ -425,53 +499,76 @@ class EnvironmentChecker:
             if lang == ref_lang:
                 continue
 
-            missing = ref_keys - keys
-            extra = keys - ref_keys
-
-            if not missing and not extra:
+            diff = ref_keys ^ keys
+            if not diff:
                 log(f"{lang}: COMPLETE ({len(keys)} keys)", "ok")
-            else:
-                if missing:
-                    log(f"{lang}: {len(missing)} missing keys", "warn")
-                    self.warnings.append(f"{lang}: {len(missing)} missing keys")
-                if extra:
-                    log(f"{lang}: {len(extra)} extra keys", "info")
-
-    def _flatten_dict(self, data: Dict, prefix: str = "") -> Set[str]:
-        """Flatten nested dict to set of keys."""
-        keys = set()
-        for key, value in data.items():
-            full_key = f"{prefix}{key}" if prefix else key
-            if isinstance(value, dict):
-                keys.update(self._flatten_dict(value, f"{full_key}{self.config.key_separator}"))
-            else:
-                keys.add(full_key)
+                continue
+
+            # Split the difference instead of scanning both full sets again
+            missing = diff & ref_keys
+            extra = diff - missing
+            if missing:
+                log(f"{lang}: {len(missing)} missing keys", "warn")
+                self.warnings.append(f"{lang}: {len(missing)} missing keys")
+            if extra:
+                log(f"{lang}: {len(extra)} extra keys", "info")
+
+    def _safe_load(self, filepath: Path) -> Tuple[Optional[FrozenSet[str]], Optional[Exception]]:
+        """Return (keys, None), (None, error), or (None, None) for a missing file."""
+        try:
+            return self._translation_keys(filepath), None
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            return None, e
+
+    def _translation_keys(self, filepath: Path) -> FrozenSet[str]:
+        """Return the flattened keys of a translation file, parsed and flattened once."""
+        path_str = str(filepath)
+        keys = self._flat_keys.get(path_str)
+        if keys is None:
+            keys = self._flat_keys[path_str] = self._flatten_dict(_load_translation(path_str))
         return keys
 
+    def _flatten_dict(self, data: Dict) -> FrozenSet[str]:
+        """Flatten nested dict to a frozen set of keys (shared between checks)."""
+        sep = self.config.key_separator
+        keys: Set[str] = set()
+        # Explicit stack instead of recursion; key parts are joined once per leaf
+        stack: List[Tuple[Dict, List[str]]] = [(data, [])]
+        while stack:
+            node, path = stack.pop()
+            for key, value in node.items():
+                if isinstance(value, dict):
+                    stack.append((value, path + [key]))
+                else:
+                    keys.add(sep.join(path + [key]))
+        return frozenset(keys)
+
     def _print_summary(self) -> None:
         """Print summary."""
         header("Summary")
 
+        lines: List[str] = []
         if self.errors:
-            print(f"{C.RED}{C.BOLD}ERRORS ({len(self.errors)}):{C.RESET}")
-            for error in self.errors:
-                print(f"  {C.RED}✗{C.RESET} {error}")
-            print()
+            lines.append(f"{C.RED}{C.BOLD}ERRORS ({len(self.errors)}):{C.RESET}")
+            lines.extend(f"  {C.RED}✗{C.RESET} {error}" for error in self.errors)
+            lines.append("")
 
         if self.warnings:
-            print(f"{C.YELLOW}{C.BOLD}WARNINGS ({len(self.warnings)}):{C.RESET}")
-            for warning in self.warnings:
-                print(f"  {C.YELLOW}!{C.RESET} {warning}")
-            print()
+            lines.append(f"{C.YELLOW}{C.BOLD}WARNINGS ({len(self.warnings)}):{C.RESET}")
+            lines.extend(f"  {C.YELLOW}!{C.RESET} {warning}" for warning in self.warnings)
+            lines.append("")
 
         if not self.errors and not self.warnings:
-            print(f"{C.GREEN}{C.BOLD}All checks passed!{C.RESET}")
-            print(f"\n{C.CYAN}System is ready for i18n operations.{C.RESET}")
+            lines.append(f"{C.GREEN}{C.BOLD}All checks passed!{C.RESET}")
+            lines.append(f"\n{C.CYAN}System is ready for i18n operations.{C.RESET}")
         elif not self.errors:
-            print(f"{C.YELLOW}{C.BOLD}Checks passed with warnings.{C.RESET}")
-            print(f"\n{C.CYAN}You can proceed, but review warnings first.{C.RESET}")
+            lines.append(f"{C.YELLOW}{C.BOLD}Checks passed with warnings.{C.RESET}")
+            lines.append(f"\n{C.CYAN}You can proceed, but review warnings first.{C.RESET}")
         else:
-            print(f"{C.RED}{C.BOLD}Fix errors before proceeding.{C.RESET}")
+            lines.append(f"{C.RED}{C.BOLD}Fix errors before proceeding.{C.RESET}")
+        _write_lines(lines)
 
 
 # ============================================================================
@@ -702,8 +799,8 @@ class TranslationValidator:
             filepath = trans_dir / f"{lang}.json"
             if filepath.exists():
                 try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        self.translations[lang] = json.load(f)
+                    with open(filepath, "rb") as f:
+                        self.translations[lang] = _json_loads(f.read())
                 except Exception:
                     self.translations[lang] = {}
             else:
@@ -1322,7 +1419,7 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> None:
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         try:
             sys.stdout.reconfigure(encoding='utf-8')
         except Exception: pass